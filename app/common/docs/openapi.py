@@ -1,7 +1,9 @@
 from typing import Any, cast
 
-from fastapi import FastAPI
+import orjson
+from fastapi import FastAPI, Request, Response
 from fastapi.openapi.utils import get_openapi
+from starlette.routing import Route
 
 
 def configure_custom_validation_openapi(app: FastAPI) -> None:
@@ -59,3 +61,19 @@ def configure_custom_validation_openapi(app: FastAPI) -> None:
         return app.openapi_schema
 
     app.openapi = custom_openapi
+
+    if not app.openapi_url:
+        return
+
+    openapi_url: str = app.openapi_url
+    openapi_body: bytes = orjson.dumps(app.openapi())
+
+    async def openapi_json(_: Request) -> Response:
+        return Response(content=openapi_body, media_type="application/json")
+
+    app.router.routes[:] = [
+        route
+        for route in app.router.routes
+        if not (isinstance(route, Route) and route.path == openapi_url)
+    ]
+    app.add_route(openapi_url, openapi_json, include_in_schema=False)
@@ -1,42 +1,62 @@
-from fastapi import Request, status
+from fastapi import Request, Response, status
 from fastapi.exceptions import RequestValidationError
-from fastapi.responses import JSONResponse
 from starlette.exceptions import HTTPException as StarletteHTTPException
+from starlette.types import Send
 
 from app.config.logging import log
-from app.models.error_model import error_response
+from app.models.error_model import error_body, error_response
+
+_INTERNAL_ERROR_MESSAGE: str = "Internal server error."
 
 
 async def http_exception_handler(
     request: Request,
     exc: StarletteHTTPException,
-) -> JSONResponse:
+) -> Response:
 
     log.error(exc.detail)
     return error_response(status=exc.status_code, message=exc.detail)
 
 
-async def validation_exception_handler(
-    request: Request,
-    exc: RequestValidationError,
-) -> JSONResponse:
-    status_code: int = status.HTTP_422_UNPROCESSABLE_CONTENT
-    parts: list[str] = []
+async def send_http_exception(send: Send, exc: StarletteHTTPException) -> None:
+    log.error(exc.detail)
 
-    for error in exc.errors():
-        loc = error["loc"]
-        msg: str = error["msg"]
+    body: bytes = error_body(exc.status_code, exc.detail)
+    headers: list[tuple[bytes, bytes]] = [
+        (b"content-length", str(len(body)).encode()),
+        (b"content-type", b"application/json"),
+    ]
 
-        loc_parts: list[str] = [str(p) for p in loc]
-        field_path: str = ".".join(loc_parts)
+    if exc.headers:
+        headers.extend(
+            (key.lower().encode("latin-1"), value.encode("latin-1"))
+            for key, value in exc.headers.items()
+        )
 
-        if field_path:
-            parts.append(f"{field_path} → {msg}")
+    await send(
+        {"type": "http.response.start", "status": exc.status_code, "headers": headers}
+    )
+    await send({"type": "http.response.body", "body": body})
 
-        else:
-            parts.append(msg)
 
-    message: str = "Validation failed: " + "; ".join(parts) + '.'
+async def validation_exception_handler(
+    request: Request,
+    exc: RequestValidationError,
+) -> Response:
+    status_code: int = status.HTTP_422_UNPROCESSABLE_CONTENT
+
+    message: str = (
+        "Validation failed: "
+        + "; ".join(
+            (
+                ".".join(map(str, error["loc"])) + " → " + error["msg"]
+                if error["loc"]
+                else error["msg"]
+            )
+            for error in exc.errors()
+        )
+        + "."
+    )
 
     log.error(message)
     return error_response(status=status_code, message=message)
@@ -45,9 +65,9 @@ async def validation_exception_handler(
 async def unhandled_exception_handler(
     request: Request,
     exc: Exception,
-) -> JSONResponse:
-    status_code: int = status.HTTP_500_INTERNAL_SERVER_ERROR
-    message: str = "Internal server error."
+) -> Response:
+    log.error(_INTERNAL_ERROR_MESSAGE)
 
-    log.error(message)
-    return error_response(status=status_code, message=message)
+    return error_response(
+        status=status.HTTP_500_INTERNAL_SERVER_ERROR, message=_INTERNAL_ERROR_MESSAGE
+    )
@@ -13,6 +13,7 @@ CheckFn = Callable[[], Awaitable[bool]]
 
 class LifecycleService(Protocol):
     name: str
+    depends_on: tuple[str, ...]
 
     async def start(self) -> None: ...
     async def stop(self) -> None: ...
@@ -23,6 +24,7 @@ class LifecycleHandler:
 
     def __init__(self) -> None:
         self._services: list[LifecycleService] = []
+        self._waves: list[list[LifecycleService]] = []
 
         self._service_health: dict[str, bool] = {}
 
@@ -36,38 +38,89 @@ class LifecycleHandler:
     def is_ready(self) -> bool:
         return self._startup_completed and not self._shutdown_started
 
-    async def are_all_services_healthy(self) -> bool:
-        for svc in self._services:
-            healthy = await svc.check()
-            if not healthy:
-                return False
-        return True
-
-    async def get_event_loop_lag(
-        self,
-        samples: int = 5,
-        interval: float = 0.02,
-    ) -> float:
-        loop = asyncio.get_running_loop()
-        delays: list[float] = []
-
-        for _ in range(samples):
-            start = loop.time()
-            await asyncio.sleep(interval)
-            end = loop.time()
-            delay = max(0.0, (end - start) - interval)
-            delays.append(delay)
-
-        return max(delays) * 1000.0 if delays else 0.0
+    async def are_all_services_healthy(self, timeout: float = 2.0) -> bool:
+        results: list[bool | BaseException] = await asyncio.gather(
+            *(asyncio.wait_for(svc.check(), timeout) for svc in self._services),
+            return_exceptions=True,
+        )
+
+        return all(result is True for result in results)
 
     def register(self, services: list[LifecycleService]) -> None:
         start = time.perf_counter()
-        log.debug(f"Registering lifecycle services ({len(services)} total)")
+        log.debug("Registering lifecycle services (%d total)", len(services))
 
         self._services.extend(services)
+        self._waves = self._plan_waves(self._services)
 
         duration = (time.perf_counter() - start) * 1000
-        log.debug(f"Lifecycle registration completed in {duration:.2f}ms")
+        log.debug("Lifecycle registration completed in %.2fms", duration)
+
+    @staticmethod
+    def _plan_waves(
+        services: list[LifecycleService],
+    ) -> list[list[LifecycleService]]:
+        names: set[str] = {svc.name for svc in services}
+        pending: dict[str, set[str]] = {}
+
+        for svc in services:
+            unknown: set[str] = set(svc.depends_on) - names
+            if unknown:
+                raise ValueError(
+                    f"Service '{svc.name}' depends on unknown services: "
+                    f"{', '.join(sorted(unknown))}"
+                )
+
+            pending[svc.name] = set(svc.depends_on)
+
+        waves: list[list[LifecycleService]] = []
+        remaining: list[LifecycleService] = list(services)
+
+        while remaining:
+            wave: list[LifecycleService] = [
+                svc for svc in remaining if not pending[svc.name]
+            ]
+
+            if not wave:
+                raise ValueError(
+                    "Circular service dependencies: "
+                    f"{', '.join(svc.name for svc in remaining)}"
+                )
+
+            ready: set[str] = {svc.name for svc in wave}
+            remaining = [svc for svc in remaining if svc.name not in ready]
+
+            for svc in remaining:
+                pending[svc.name] -= ready
+
+            waves.append(wave)
+
+        return waves
+
+    async def _start_service(self, svc: LifecycleService) -> None:
+        await svc.start()
+        log.debug("Service started → %s", svc.name)
+
+    async def _stop_service(self, svc: LifecycleService) -> None:
+        stop_task: asyncio.Task[None] = asyncio.ensure_future(self._run_stop(svc))
+
+        try:
+            await asyncio.shield(stop_task)
+        except asyncio.CancelledError:
+            log.warning("Shutdown cancelled, finishing stop ← %s", svc.name)
+            await stop_task
+            raise
+
+    async def _run_stop(self, svc: LifecycleService) -> None:
+        try:
+            await svc.stop()
+            log.debug("Service stopped ← %s", svc.name)
+        except Exception as exc:
+            error_type = exc.__class__.__name__
+            error_msg = getattr(exc, "msg", None) or str(exc).split("\n")[0]
+            log.error("%s — %s", error_type, error_msg)
+
+            log.warning("Failed to stop service ← %s", svc.name)
 
     async def startup(self) -> None:
         if self._startup_started:
@@ -77,14 +130,13 @@ class LifecycleHandler:
         start = time.perf_counter()
         log.debug('Starting services…')
 
-        for svc in self._services:
-            await svc.start()
-            log.debug(f"Service started → {svc.name}")
+        for wave in self._waves:
+            await asyncio.gather(*(self._start_service(svc) for svc in wave))
 
         self._startup_completed = True
 
         duration = (time.perf_counter() - start) * 1000
-        log.debug(f"All services started in {duration:.2f}ms")
+        log.debug("All services started in %.2fms", duration)
 
     async def shutdown(self, sig: signal.Signals | None = None) -> None:
         if self._shutdown_started:
@@ -95,19 +147,19 @@ class LifecycleHandler:
 
         log.debug("Stopping services…")
 
-        for svc in reversed(self._services):
-            try:
-                await svc.stop()
-                log.debug(f"Service stopped ← {svc.name}")
-            except Exception as exc:
-                error_type = exc.__class__.__name__
-                error_msg = getattr(exc, "msg", None) or str(exc).split("\n")[0]
-                log.error(f"{error_type} — {error_msg}")
+        cancelled: asyncio.CancelledError | None = None
 
-                log.warning(f"Failed to stop service ← {svc.name}")
+        for wave in reversed(self._waves):
+            try:
+                await asyncio.gather(*(self._stop_service(svc) for svc in wave))
+            except asyncio.CancelledError as exc:
+                cancelled = exc
 
         duration = (time.perf_counter() - start) * 1000
-        log.debug(f"Shutdown completed in {duration:.2f}ms")
+        log.debug("Shutdown completed in %.2fms", duration)
+
+        if cancelled is not None:
+            raise cancelled
 
 
 lifecycle = LifecycleHandler()
@@ -1,12 +1,15 @@
 from __future__ import annotations
 
 from fastapi import status
-from fastapi.responses import JSONResponse
 from starlette.exceptions import HTTPException
-from starlette.requests import Request
-from starlette.types import ASGIApp, Message, Receive, Scope, Send
+from starlette.types import ASGIApp, Receive, Scope, Send
 
-from app.common.handlers.exception_handler import http_exception_handler
+from app.common.handlers.exception_handler import send_http_exception
+from app.common.middleware.headers import PrefixMatcher, find_header
+
+AllowedTypes = tuple[frozenset[str], str]
+
+_BODY_METHODS: frozenset[str] = frozenset({"POST", "PUT", "PATCH"})
 
 
 class ContentTypeEnforcementASGIMiddleware:
@@ -18,18 +21,32 @@ class ContentTypeEnforcementASGIMiddleware:
         default_allowed: set[str] | None = None,
         route_overrides: list[tuple[str, set[str]]] | None = None,
     ) -> None:
+        """Overrides apply by path prefix; when several match, the longest wins."""
         self.app = app
-        self.default_allowed = default_allowed or {"application/json"}
-        self.route_overrides = route_overrides or []
-
-        self.no_body_methods = {"GET", "DELETE", "HEAD", "OPTIONS"}
-
-    def _allowed_for_path(self, path: str) -> set[str]:
-        for prefix, allowed in self.route_overrides:
-            if path.startswith(prefix):
-                return allowed
-
-        return self.default_allowed
+        self.default_allowed: AllowedTypes = self._freeze(
+            default_allowed or {"application/json"}
+        )
+        self.route_overrides = list(route_overrides or [])
+        self._allowed: PrefixMatcher[AllowedTypes] = PrefixMatcher(
+            [
+                (prefix, self._freeze(allowed))
+                for prefix, allowed in self.route_overrides
+            ],
+            self.default_allowed,
+        )
+
+        self.no_body_methods: frozenset[str] = frozenset(
+            {"GET", "DELETE", "HEAD", "OPTIONS"}
+        )
+
+    @staticmethod
+    def _freeze(allowed: set[str]) -> AllowedTypes:
+        types: frozenset[str] = frozenset(media.lower() for media in allowed)
+
+        return types, str(sorted(types))
+
+    def _allowed_for_path(self, path: str) -> AllowedTypes:
+        return self._allowed.match(path)
 
     async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
         if scope["type"] != "http":
@@ -39,21 +56,15 @@ class ContentTypeEnforcementASGIMiddleware:
             await self._run_content_type_logic(scope, receive, send)
 
         except HTTPException as exc:
-            request: Request = Request(scope, receive=receive)
-            response: JSONResponse = await http_exception_handler(request, exc)
-
-            async def empty_receive() -> Message:
-                return {"type": "http.request", "body": b"", "more_body": False}
-
-            return await response(scope, empty_receive, send)
+            return await send_http_exception(send, exc)
 
     async def _run_content_type_logic(self, scope: Scope, receive: Receive, send: Send):
         method: str = scope.get("method", "").upper()
         path: str = scope.get("path", "")
-        raw_headers = scope.get("headers", [])
-
-        header_map = {k.decode().lower(): v.decode() for k, v in raw_headers}
-        content_type = header_map.get("content-type")
+        raw_content_type: bytes | None = find_header(scope, b"content-type")
+        content_type: str | None = (
+            raw_content_type.decode("latin-1") if raw_content_type is not None else None
+        )
 
         if method in self.no_body_methods:
             if content_type is not None:
@@ -64,8 +75,8 @@ class ContentTypeEnforcementASGIMiddleware:
 
             return await self.app(scope, receive, send)
 
-        if method in {"POST", "PUT", "PATCH"}:
-            allowed: set[str] = self._allowed_for_path(path)
+        if method in _BODY_METHODS:
+            allowed, expected = self._allowed_for_path(path)
 
             if content_type is None:
                 raise HTTPException(
@@ -73,14 +84,14 @@ class ContentTypeEnforcementASGIMiddleware:
                     detail="Missing Content-Type header.",
                 )
 
-            normalized = content_type.split(";")[0].strip().lower()
+            normalized: str = content_type.partition(";")[0].strip().lower()
 
             if normalized not in allowed:
                 raise HTTPException(
                     status_code=status.HTTP_415_UNSUPPORTED_MEDIA_TYPE,
                     detail=(
                         f"Content-Type '{content_type}' is not allowed on this endpoint. "
-                        f"Expected one of: {sorted(allowed)}."
+                        f"Expected one of: {expected}."
                     ),
                 )
 
@@ -3,12 +3,11 @@ from __future__ import annotations
 from collections.abc import Iterable
 
 from fastapi import status
-from fastapi.responses import JSONResponse
 from starlette.exceptions import HTTPException
-from starlette.requests import Request
 from starlette.types import ASGIApp, Message, Receive, Scope, Send
 
-from app.common.handlers.exception_handler import http_exception_handler
+from app.common.handlers.exception_handler import send_http_exception
+from app.common.middleware.headers import find_header
 
 
 class CustomCORSASGIMiddleware:
@@ -25,13 +24,45 @@ class CustomCORSASGIMiddleware:
         max_age: int = 86400,
     ) -> None:
         self.app = app
-        self.opts_origin = origin
+        self._allow_all: bool = (
+            origin == "*" if isinstance(origin, str) else "*" in origin
+        )
+        self._allowed_origins: frozenset[str] = (
+            frozenset()
+            if self._allow_all
+            else frozenset({origin} if isinstance(origin, str) else origin)
+        )
         self.opts_methods = {m.upper() for m in methods}
         self.opts_allowed_headers = list(allowed_headers)
         self.opts_exposed_headers = list(exposed_headers)
         self.credentials = credentials
         self.max_age = max_age
 
+        methods_value: bytes = ", ".join(self.opts_methods).encode()
+        allowed_headers_value: bytes = ", ".join(self.opts_allowed_headers).encode()
+        max_age_value: bytes = str(self.max_age).encode()
+        credentials_headers: list[tuple[bytes, bytes]] = (
+            [(b"access-control-allow-credentials", b"true")] if credentials else []
+        )
+
+        self._response_headers: list[tuple[bytes, bytes]] = [
+            (b"access-control-allow-methods", methods_value),
+            (b"access-control-allow-headers", allowed_headers_value),
+            (
+                b"access-control-expose-headers",
+                ", ".join(self.opts_exposed_headers).encode(),
+            ),
+            (b"access-control-max-age", max_age_value),
+            *credentials_headers,
+        ]
+
+        self._preflight_headers: list[tuple[bytes, bytes]] = [
+            (b"access-control-allow-methods", methods_value),
+            (b"access-control-allow-headers", allowed_headers_value),
+            (b"access-control-max-age", max_age_value),
+            *credentials_headers,
+        ]
+
     async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
         if scope["type"] != "http":
             return await self.app(scope, receive, send)
@@ -39,18 +70,14 @@ class CustomCORSASGIMiddleware:
         try:
             await self._run_cors_logic(scope, receive, send)
         except HTTPException as exc:
-            request: Request = Request(scope, receive=receive)
-            response: JSONResponse = await http_exception_handler(request, exc)
-
-            async def empty_receive() -> Message:
-                return {"type": "http.request", "body": b"", "more_body": False}
-
-            await response(scope, empty_receive, send)
+            await send_http_exception(send, exc)
 
     async def _run_cors_logic(self, scope: Scope, receive: Receive, send: Send) -> None:
         method = scope["method"].upper()
-        headers: dict[str, str] = self._extract_headers(scope)
-        origin: str | None = headers.get("origin")
+        origin: str | None = self._extract_origin(scope)
+
+        if origin is None and method != "OPTIONS":
+            return await self.app(scope, receive, send)
 
         if not self._is_allowed_origin(origin):
             raise HTTPException(
@@ -61,88 +88,44 @@ class CustomCORSASGIMiddleware:
         if method == "OPTIONS":
             return await self._respond_preflight(origin, scope, send)
 
+        allow_origin: tuple[bytes, bytes] = (
+            b"access-control-allow-origin",
+            (origin or "*").encode("latin-1"),
+        )
+
         async def send_wrapper(message: Message) -> None:
             if message["type"] == "http.response.start":
                 headers_list: list[tuple[bytes, bytes]] = message.setdefault(
                     "headers", []
                 )
 
-                self._append_header(
-                    headers_list, "access-control-allow-origin", origin or "*"
-                )
-                self._append_header(
-                    headers_list,
-                    "access-control-allow-methods",
-                    ", ".join(self.opts_methods),
-                )
-                self._append_header(
-                    headers_list,
-                    "access-control-allow-headers",
-                    ", ".join(self.opts_allowed_headers),
-                )
-                self._append_header(
-                    headers_list,
-                    "access-control-expose-headers",
-                    ", ".join(self.opts_exposed_headers),
-                )
-                self._append_header(
-                    headers_list, "access-control-max-age", str(self.max_age)
-                )
-
-                if self.credentials:
-                    self._append_header(
-                        headers_list, "access-control-allow-credentials", "true"
-                    )
+                headers_list.append(allow_origin)
+                headers_list.extend(self._response_headers)
 
             await send(message)
 
         await self.app(scope, receive, send_wrapper)
 
     @staticmethod
-    def _extract_headers(scope: Scope) -> dict[str, str]:
-        return {
-            key.decode().lower(): value.decode()
-            for key, value in scope.get("headers", [])
-        }
+    def _extract_origin(scope: Scope) -> str | None:
+        origin: bytes | None = find_header(scope, b"origin")
 
-    def _is_allowed_origin(self, origin: str | None) -> bool:
-        if not origin:
-            return True
+        return origin.decode("latin-1") if origin is not None else None
 
-        opts: str | list[str] = self.opts_origin
-
-        if opts == "*" or (isinstance(opts, list) and "*" in opts):
-            return True
-
-        if isinstance(opts, list):
-            return origin in opts
-
-        return opts == origin
-
-    @staticmethod
-    def _append_header(
-        headers_list: list[tuple[bytes, bytes]], key: str, value: str
-    ) -> None:
-        headers_list.append((key.encode(), value.encode()))
+    def _is_allowed_origin(self, origin: str | None) -> bool:
+        return self._allow_all or not origin or origin in self._allowed_origins
 
     async def _respond_preflight(
         self, origin: str | None, scope: Scope, send: Send
     ) -> None:
-        from starlette.responses import Response
-
-        headers: dict[str, str] = {
-            "Access-Control-Allow-Origin": origin or "*",
-            "Access-Control-Allow-Methods": ", ".join(self.opts_methods),
-            "Access-Control-Allow-Headers": ", ".join(self.opts_allowed_headers),
-            "Access-Control-Max-Age": str(self.max_age),
-        }
-
-        if self.credentials:
-            headers["Access-Control-Allow-Credentials"] = "true"
-
-        response: Response = Response(status_code=204, headers=headers)
-
-        async def empty_receive() -> Message:
-            return {"type": "http.request", "body": b"", "more_body": False}
-
-        await response(scope, empty_receive, send)
+        await send(
+            {
+                "type": "http.response.start",
+                "status": status.HTTP_204_NO_CONTENT,
+                "headers": [
+                    (b"access-control-allow-origin", (origin or "*").encode("latin-1")),
+                    *self._preflight_headers,
+                ],
+            }
+        )
+        await send({"type": "http.response.body", "body": b""})
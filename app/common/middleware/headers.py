@@ -0,0 +1,50 @@
+import re
+from collections.abc import Sequence
+
+from starlette.types import Scope
+
+
+def find_header(scope: Scope, name: bytes) -> bytes | None:
+    key: bytes
+    value: bytes
+
+    for key, value in scope.get("headers", ()):
+        if key == name:
+            return value
+
+    return None
+
+
+class PrefixMatcher[T]:
+    """Resolve a path to the value of its longest matching prefix, or the default."""
+
+    def __init__(self, overrides: Sequence[tuple[str, T]], default: T) -> None:
+        self.default: T = default
+        self.overrides: list[tuple[str, T]] = sorted(
+            overrides, key=lambda override: len(override[0]), reverse=True
+        )
+
+        self._pattern: re.Pattern[str] | None = (
+            re.compile(
+                "|".join(
+                    f"(?P<r{index}>{re.escape(prefix)})"
+                    for index, (prefix, _) in enumerate(self.overrides)
+                )
+            )
+            if self.overrides
+            else None
+        )
+        self._value_by_group: dict[str, T] = {
+            f"r{index}": value for index, (_, value) in enumerate(self.overrides)
+        }
+
+    def match(self, path: str) -> T:
+        if self._pattern is None:
+            return self.default
+
+        match: re.Match[str] | None = self._pattern.match(path)
+
+        if match is None or match.lastgroup is None:
+            return self.default
+
+        return self._value_by_group[match.lastgroup]
@@ -0,0 +1,21 @@
+from __future__ import annotations
+
+from collections.abc import Mapping
+
+from starlette.types import ASGIApp, Receive, Scope, Send
+
+
+class ProbeShortCircuitASGIMiddleware:
+
+    def __init__(self, app: ASGIApp, *, routes: Mapping[str, ASGIApp]) -> None:
+        self.app = app
+        self.routes = dict(routes)
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        if scope["type"] == "http" and scope["method"] == "GET":
+            handler: ASGIApp | None = self.routes.get(scope["path"])
+
+            if handler is not None:
+                return await handler(scope, receive, send)
+
+        await self.app(scope, receive, send)
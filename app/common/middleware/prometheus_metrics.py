@@ -1,7 +1,8 @@
 from __future__ import annotations
 
-import time
+from time import perf_counter_ns
 
+from prometheus_client import Counter, Histogram
 from starlette.types import ASGIApp, Message, Receive, Scope, Send
 
 from app.config.metrics import REQUEST_COUNT, REQUEST_LATENCY
@@ -9,22 +10,30 @@ from app.config.metrics import REQUEST_COUNT, REQUEST_LATENCY
 
 class PrometheusASGIMiddleware:
 
-    def __init__(self, app: ASGIApp) -> None:
+    def __init__(
+        self,
+        app: ASGIApp,
+        *,
+        exclude_paths: frozenset[str] = frozenset({"/metrics", "/health", "/ready"}),
+    ) -> None:
         self.app = app
+        self.exclude_paths = exclude_paths
+        self._latency_children: dict[tuple[str, str], Histogram] = {}
+        self._count_children: dict[tuple[str, str, int], Counter] = {}
 
     async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
-        if scope["type"] != "http":
+        if scope["type"] != "http" or scope["path"] in self.exclude_paths:
             return await self.app(scope, receive, send)
 
         method: str = scope["method"]
-        path: str = scope.get("path", "")
-
-        start: float = time.perf_counter()
-        status_code_holder: dict[str, str] = {"status": "0"}
+        start_ns: int = perf_counter_ns()
+        status_code: int = 0
 
         async def send_wrapper(message: Message):
+            nonlocal status_code
+
             if message["type"] == "http.response.start":
-                status_code_holder["status"] = str(message["status"])
+                status_code = message["status"]
 
             await send(message)
 
@@ -32,7 +41,29 @@ class PrometheusASGIMiddleware:
             await self.app(scope, receive, send_wrapper)
 
         finally:
-            latency: float = time.perf_counter() - start
+            latency: float = (perf_counter_ns() - start_ns) * 1e-9
+            path: str | None = getattr(scope.get("route"), "path", None)
+
+            if path is not None:
+                self._latency(method, path).observe(latency)
+                self._count(method, path, status_code).inc()
+
+    def _latency(self, method: str, path: str) -> Histogram:
+        key: tuple[str, str] = (method, path)
+        child: Histogram | None = self._latency_children.get(key)
+
+        if child is None:
+            child = self._latency_children[key] = REQUEST_LATENCY.labels(method, path)
+
+        return child
+
+    def _count(self, method: str, path: str, status_code: int) -> Counter:
+        key: tuple[str, str, int] = (method, path, status_code)
+        child: Counter | None = self._count_children.get(key)
+
+        if child is None:
+            child = self._count_children[key] = REQUEST_COUNT.labels(
+                method, path, str(status_code)
+            )
 
-            REQUEST_LATENCY.labels(method, path).observe(latency)
-            REQUEST_COUNT.labels(method, path, status_code_holder["status"]).inc()
+        return child
@@ -1,23 +1,23 @@
 from __future__ import annotations
 
+from collections.abc import Awaitable
+
 from fastapi import status
-from fastapi.responses import JSONResponse
 from starlette.exceptions import HTTPException
-from starlette.requests import Request
-from starlette.types import ASGIApp, Message, Receive, Scope, Send
+from starlette.types import ASGIApp, Receive, Scope, Send
 
-from app.common.handlers.exception_handler import http_exception_handler
-from app.config.rate_limiter import RateLimiter
+from app.common.handlers.exception_handler import send_http_exception
+from app.config.rate_limiter import RateLimitBackend
 
 
-def get_client_ip(request: Request) -> str:
-    client = request.client
-    return client.host if client else "unknown"
+def get_client_ip(scope: Scope) -> str:
+    client = scope.get("client")
+    return client[0] if client else "unknown"
 
 
 class RateLimitASGIMiddleware:
 
-    def __init__(self, app: ASGIApp, limiter: RateLimiter) -> None:
+    def __init__(self, app: ASGIApp, limiter: RateLimitBackend) -> None:
         self.app = app
         self.limiter = limiter
 
@@ -29,19 +29,13 @@ class RateLimitASGIMiddleware:
             await self._run_rate_limit(scope, receive, send)
 
         except HTTPException as exc:
-            request: Request = Request(scope, receive=receive)
-            response: JSONResponse = await http_exception_handler(request, exc)
-
-            async def empty_receive() -> Message:
-                return {"type": "http.request", "body": b"", "more_body": False}
-
-            return await response(scope, empty_receive, send)
+            return await send_http_exception(send, exc)
 
     async def _run_rate_limit(self, scope: Scope, receive: Receive, send: Send) -> None:
-        request: Request = Request(scope)
-        ip: str = get_client_ip(request)
+        ip: str = get_client_ip(scope)
 
-        allowed: bool = self.limiter.allow(ip)
+        result: bool | Awaitable[bool] = self.limiter.allow(ip)
+        allowed: bool = result if isinstance(result, bool) else await result
 
         if not allowed:
             raise HTTPException(
@@ -5,14 +5,10 @@ from dataclasses import dataclass
 
 from fastapi import status
 from starlette.exceptions import HTTPException
-from starlette.requests import Request
 from starlette.types import ASGIApp, Message, Receive, Scope, Send
 
-from app.common.handlers.exception_handler import http_exception_handler
-
-
-async def empty_receive() -> Message:
-    return {"type": "http.request", "body": b"", "more_body": False}
+from app.common.handlers.exception_handler import send_http_exception
+from app.common.middleware.headers import PrefixMatcher, find_header
 
 
 def format_bytes_as_mb(value: int) -> str:
@@ -53,13 +49,13 @@ class RequestBodyLimitASGIMiddleware:
     ) -> None:
         self.app = app
         self.default_limit = default_limit
-        self.route_overrides = route_overrides or []
+        self.route_overrides = list(route_overrides or [])
+        self._limits: PrefixMatcher[BodyLimit] = PrefixMatcher(
+            self.route_overrides, default_limit
+        )
 
     def _select_limit(self, path: str) -> BodyLimit:
-        for prefix, override in self.route_overrides:
-            if path.startswith(prefix):
-                return override
-        return self.default_limit
+        return self._limits.match(path)
 
     async def __call__(
         self,
@@ -76,9 +72,7 @@ class RequestBodyLimitASGIMiddleware:
             await self._run(scope, receive, send)
 
         except HTTPException as exc:
-            request = Request(scope, receive=receive)
-            response = await http_exception_handler(request, exc)
-            await response(scope, empty_receive, send)
+            await send_http_exception(send, exc)
 
     async def _run(
         self,
@@ -91,8 +85,7 @@ class RequestBodyLimitASGIMiddleware:
         limit: BodyLimit = self._select_limit(path)
         max_bytes: int = limit.max_body_bytes
 
-        headers = {k.decode().lower(): v.decode() for k, v in scope.get("headers", [])}
-        content_length = headers.get("content-length")
+        content_length: bytes | None = find_header(scope, b"content-length")
 
         if content_length is not None:
             try:
@@ -113,7 +106,6 @@ class RequestBodyLimitASGIMiddleware:
                 )
 
         total: int = 0
-        body_chunks: list[bytes] = []
 
         async def limited_receive() -> Message:
             nonlocal total
@@ -136,22 +128,8 @@ class RequestBodyLimitASGIMiddleware:
                             ),
                         )
 
-                    body_chunks.append(chunk)
-
             return message
 
-        async def replay_body() -> Message:
-            nonlocal body_chunks
-
-            if body_chunks:
-                merged: bytes = b"".join(body_chunks)
-                body_chunks = []
-
-                return {"type": "http.request", "body": merged, "more_body": False}
-            return await empty_receive()
-
-        scope["_body_replay"] = replay_body
-
         async def send_wrapper(message: Message) -> None:
             if message["type"] == "http.response.start":
                 remaining: int = max(max_bytes - total, 0)
@@ -1,19 +1,21 @@
 from __future__ import annotations
 
 import re
+from dataclasses import dataclass
 from typing import ClassVar
 
 from fastapi import status
-from fastapi.responses import JSONResponse
 from starlette.exceptions import HTTPException
-from starlette.requests import Request
-from starlette.types import ASGIApp, Message, Receive, Scope, Send
+from starlette.types import ASGIApp, Receive, Scope, Send
 
-from app.common.handlers.exception_handler import http_exception_handler
+from app.common.handlers.exception_handler import send_http_exception
 
 
-async def empty_receive() -> Message:
-    return {"type": "http.request", "body": b"", "more_body": False}
+@dataclass(frozen=True)
+class HeaderLimits:
+    max_header_count: int = 100
+    max_single_header_bytes: int = 4_096
+    max_total_header_bytes: int = 8_192
 
 
 class HeaderSanitizationASGIMiddleware:
@@ -47,6 +49,7 @@ class HeaderSanitizationASGIMiddleware:
         "user-agent",
         "referer",
         "origin",
+        "if-none-match",
         "cookie",
         "sec-fetch-site",
         "sec-fetch-mode",
@@ -63,9 +66,15 @@ class HeaderSanitizationASGIMiddleware:
     VALID_NAME_RE: re.Pattern[str] = re.compile(r"^[A-Za-z0-9-]+$")
     INVALID_VALUE_CHARS: ClassVar[set[str]] = {"\r", "\n"}
 
-    def __init__(self, app: ASGIApp, extra_allowed: set[str] | None = None):
+    def __init__(
+        self,
+        app: ASGIApp,
+        extra_allowed: set[str] | None = None,
+        limits: HeaderLimits = HeaderLimits(),
+    ) -> None:
         self.app = app
         self.allowed = self.ALLOWLIST | (extra_allowed or set())
+        self.limits = limits
 
     async def __call__(
         self,
@@ -80,10 +89,7 @@ class HeaderSanitizationASGIMiddleware:
             await self._run(scope, receive, send)
 
         except HTTPException as exc:
-            request: Request = Request(scope, receive=receive)
-            response: JSONResponse = await http_exception_handler(request, exc)
-
-            await response(scope, empty_receive, send)
+            await send_http_exception(send, exc)
 
     async def _run(
         self,
@@ -92,10 +98,31 @@ class HeaderSanitizationASGIMiddleware:
         send: Send,
     ) -> None:
         raw_headers = scope.get("headers", [])
+        limits: HeaderLimits = self.limits
+
+        if len(raw_headers) > limits.max_header_count:
+            raise HTTPException(
+                status_code=status.HTTP_431_REQUEST_HEADER_FIELDS_TOO_LARGE,
+                detail=f"Too many headers (limit = {limits.max_header_count}).",
+            )
+
         cleaned_headers: list[tuple[bytes, bytes]] = []
         seen: set[str] = set()
+        total_bytes: int = 0
 
         for raw_name, raw_value in raw_headers:
+            size: int = len(raw_name) + len(raw_value)
+            total_bytes += size
+
+            if size > limits.max_single_header_bytes:
+                raise HTTPException(
+                    status_code=status.HTTP_431_REQUEST_HEADER_FIELDS_TOO_LARGE,
+                    detail=(
+                        f"Header exceeds per-header size limit "
+                        f"({limits.max_single_header_bytes} bytes)."
+                    ),
+                )
+
             name = raw_name.decode().lower()
             value = raw_value.decode()
 
@@ -130,6 +157,15 @@ class HeaderSanitizationASGIMiddleware:
 
             cleaned_headers.append((raw_name, raw_value))
 
+        if total_bytes > limits.max_total_header_bytes:
+            raise HTTPException(
+                status_code=status.HTTP_431_REQUEST_HEADER_FIELDS_TOO_LARGE,
+                detail=(
+                    f"Total header size exceeds limit "
+                    f"({limits.max_total_header_bytes} bytes)."
+                ),
+            )
+
         scope["headers"] = cleaned_headers
 
         await self.app(scope, receive, send)
@@ -0,0 +1,102 @@
+import logging
+import uuid
+from time import perf_counter
+
+from starlette.types import ASGIApp, Message, Receive, Scope, Send
+
+from app.common.store.request_context import RequestContext, RequestContextData
+from app.config.logging import log
+
+_LEVEL_BY_STATUS_CLASS: tuple[int, ...] = (
+    logging.INFO,
+    logging.INFO,
+    logging.INFO,
+    logging.INFO,
+    logging.WARNING,
+    logging.ERROR,
+)
+
+
+def shorten_path(path: str, max_len: int = 30) -> str:
+    if len(path) > max_len:
+        return path[: max_len - 1] + "…"
+
+    return path
+
+
+class RequestPipelineASGIMiddleware:
+
+    def __init__(
+        self,
+        app: ASGIApp,
+        quiet_paths: frozenset[str] = frozenset({"/health", "/ready"}),
+    ) -> None:
+        self.app = app
+        self.quiet_paths = quiet_paths
+        self._log: logging.Logger = log
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        if scope["type"] != "http":
+            return await self.app(scope, receive, send)
+
+        start: float = perf_counter()
+        request_id: str = uuid.uuid4().hex[:8]
+
+        method = scope["method"]
+        path = scope["path"]
+
+        client = scope.get("client", ["unknown"])[0]
+
+        scope["ctx"] = {
+            "request_id": request_id,
+            "method": method,
+            "path": path,
+            "ip": client,
+        }
+
+        RequestContext.set(
+            RequestContextData(
+                request_id=request_id,
+                method=method,
+                path=path,
+                ip=client,
+            )
+        )
+
+        status: int | None = None
+
+        async def send_wrapper(message: Message):
+            nonlocal status
+
+            if message["type"] == "http.response.start":
+                status = message["status"]
+
+            await send(message)
+
+        try:
+            await self.app(scope, receive, send_wrapper)
+
+        finally:
+            status_code: int = status if status is not None else 500
+
+            if status_code >= 400 or path not in self.quiet_paths:
+                self._log_request(status_code, method, path, start)
+
+            RequestContext.clear()
+
+    def _log_request(
+        self, status_code: int, method: str, path: str, start: float
+    ) -> None:
+        level: int = _LEVEL_BY_STATUS_CLASS[min(status_code // 100, 5)]
+
+        if not self._log.isEnabledFor(level):
+            return
+
+        self._log.log(
+            level,
+            "%-3d %-7s %-32s %.2fms",
+            status_code,
+            method,
+            shorten_path(path, 30),
+            (perf_counter() - start) * 1000,
+        )
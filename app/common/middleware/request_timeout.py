@@ -3,16 +3,10 @@ from __future__ import annotations
 import asyncio
 
 from fastapi import status
-from fastapi.responses import JSONResponse
 from starlette.exceptions import HTTPException
-from starlette.requests import Request
 from starlette.types import ASGIApp, Message, Receive, Scope, Send
 
-from app.common.handlers.exception_handler import http_exception_handler
-
-
-async def empty_receive() -> Message:
-    return {"type": "http.request", "body": b"", "more_body": False}
+from app.common.handlers.exception_handler import send_http_exception
 
 
 class RequestTimeoutASGIMiddleware:
@@ -41,10 +35,7 @@ class RequestTimeoutASGIMiddleware:
             await self._run(scope, receive, send)
 
         except HTTPException as exc:
-            request: Request = Request(scope, receive=receive)
-            response: JSONResponse = await http_exception_handler(request, exc)
-
-            await response(scope, empty_receive, send)
+            await send_http_exception(send, exc)
 
     async def _run(
         self,
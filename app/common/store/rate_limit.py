@@ -1,24 +1,24 @@
 from __future__ import annotations
 
 from dataclasses import dataclass
-from time import monotonic
 
 
-@dataclass
+@dataclass(slots=True)
 class RateLimitState:
-    burst_tokens: float
-    sustained_tokens: float
-    last_burst_reset: float
-    last_refill: float
-    last_seen: float
+    burst_tokens: int
+    sustained_milli: int
+    last_burst_reset_ns: int
+    last_refill_ns: int
+    last_seen_ns: int
 
     @classmethod
-    def new(cls, max_burst: int, max_sustained: int) -> RateLimitState:
-        now = monotonic()
+    def new(
+        cls, max_burst: int, max_sustained_milli: int, now_ns: int
+    ) -> RateLimitState:
         return cls(
             burst_tokens=max_burst,
-            sustained_tokens=max_sustained,
-            last_burst_reset=now,
-            last_refill=now,
-            last_seen=now,
+            sustained_milli=max_sustained_milli,
+            last_burst_reset_ns=now_ns,
+            last_refill_ns=now_ns,
+            last_seen_ns=now_ns,
         )
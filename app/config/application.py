@@ -3,6 +3,7 @@ from contextlib import asynccontextmanager
 
 from fastapi import FastAPI
 from fastapi.exceptions import RequestValidationError
+from fastapi.responses import ORJSONResponse
 from starlette.exceptions import HTTPException as StarletteHTTPException
 
 from app.common.docs.openapi import configure_custom_validation_openapi
@@ -17,30 +18,31 @@ from app.common.middleware.content_type_enforcement import (
 )
 from app.common.middleware.cors import CustomCORSASGIMiddleware
 from app.common.middleware.method_whitelist import MethodWhitelistASGIMiddleware
+from app.common.middleware.probe_short_circuit import (
+    ProbeShortCircuitASGIMiddleware,
+)
 from app.common.middleware.prometheus_metrics import PrometheusASGIMiddleware
 from app.common.middleware.rate_limit import RateLimitASGIMiddleware
 from app.common.middleware.request_body_limit import (
     BodyLimit,
     RequestBodyLimitASGIMiddleware,
 )
-from app.common.middleware.request_cleanup import RequestCleanupASGIMiddleware
-from app.common.middleware.request_context import RequestContextASGIMiddleware
-from app.common.middleware.request_header_limit import (
-    HeaderLimits,
-    RequestHeaderLimitASGIMiddleware,
-)
 from app.common.middleware.request_header_sanitization import (
+    HeaderLimits,
     HeaderSanitizationASGIMiddleware,
 )
-from app.common.middleware.request_logger import RequestLoggingASGIMiddleware
+from app.common.middleware.request_pipeline import RequestPipelineASGIMiddleware
 from app.common.middleware.request_timeout import RequestTimeoutASGIMiddleware
 from app.common.middleware.security_headers import SecurityHeadersMiddleware
 from app.config.database import DatabaseService
 from app.config.environment import settings
-from app.config.logging import log
+from app.config.logging import log, start_log_listener
 from app.config.rate_limiter import RateLimiter
 from app.server.api.api_routes import router as api_router
+from app.server.system.controllers.system_controller import live_asgi
 from app.server.system.controllers.system_controller import router as system_router
+from app.server.system.services.event_loop_lag_service import EventLoopLagService
+from app.server.system.services.uptime_service import UptimeService
 
 
 @asynccontextmanager
@@ -48,14 +50,16 @@ async def lifespan(_: FastAPI):
     name, version, mode = settings.APP_NAME, settings.APP_VERSION, settings.ENV
     pyv: str = sys.version.split()[0]
 
+    start_log_listener()
+
     try:
-        log.info(f"Booting {name} v{version} ({mode}) — Python v{pyv}")
+        log.info("Booting %s v%s (%s) — Python v%s", name, version, mode, pyv)
 
-        lifecycle.register([DatabaseService()])
+        lifecycle.register([DatabaseService(), UptimeService(), EventLoopLagService()])
         await lifecycle.startup()
 
         port: int = settings.PORT
-        log.info(f"HTTP server running on port {port} — http://localhost:{port}")
+        log.info("HTTP server running on port %d — http://localhost:%d", port, port)
 
         yield
 
@@ -63,7 +67,7 @@ async def lifespan(_: FastAPI):
         error_type: str = exc.__class__.__name__
         error_msg: str = getattr(exc, "msg", None) or str(exc).split("\n")[0]
 
-        log.error(f"{error_type} — {error_msg}", exception=exc)
+        log.error("%s — %s", error_type, error_msg, exc_info=exc)
 
         log.critical('Unhandled fatal error during server runtime — forcing exit')
 
@@ -85,6 +89,7 @@ def create_app() -> FastAPI:
         title=name,
         version=version,
         lifespan=lifespan,
+        default_response_class=ORJSONResponse,
     )
 
     app.add_middleware(PrometheusASGIMiddleware)
@@ -106,16 +111,14 @@ def create_app() -> FastAPI:
     )
 
     app.add_middleware(
-        RequestHeaderLimitASGIMiddleware,
+        HeaderSanitizationASGIMiddleware,
         limits=HeaderLimits(
             max_header_count=100,
             max_single_header_bytes=4_096,
             max_total_header_bytes=8_192,
-            allow_chunked=False,
         ),
     )
 
-    app.add_middleware(HeaderSanitizationASGIMiddleware)
     app.add_middleware(
         ContentTypeEnforcementASGIMiddleware,
         default_allowed={"application/json", "multipart/form-data"},
@@ -139,9 +142,8 @@ def create_app() -> FastAPI:
         max_age=86_400,
     )
 
-    app.add_middleware(RequestLoggingASGIMiddleware)
-    app.add_middleware(RequestContextASGIMiddleware)
-    app.add_middleware(RequestCleanupASGIMiddleware)
+    app.add_middleware(RequestPipelineASGIMiddleware)
+    app.add_middleware(ProbeShortCircuitASGIMiddleware, routes={"/health": live_asgi})
 
     app.exception_handler(RequestValidationError)(validation_exception_handler)
     app.exception_handler(StarletteHTTPException)(http_exception_handler)
@@ -1,7 +1,10 @@
+import asyncio
 from collections.abc import AsyncGenerator
+from typing import Any
 
-from sqlalchemy import text
+from sqlalchemy import URL, TextClause, event, make_url, text
 from sqlalchemy.ext.asyncio import (
+    AsyncConnection,
     AsyncEngine,
     AsyncSession,
     async_sessionmaker,
@@ -9,7 +12,32 @@ from sqlalchemy.ext.asyncio import (
 )
 from sqlalchemy.orm import DeclarativeBase
 
-DATABASE_URL = "sqlite+aiosqlite:///./app.db"
+from app.config.environment import settings
+
+_ASYNC_DRIVERS: dict[str, str] = {
+    "sqlite": "aiosqlite",
+    "mysql": "asyncmy",
+}
+
+
+def async_database_url(raw: str) -> URL:
+    url: URL = make_url(raw)
+    driver: str | None = _ASYNC_DRIVERS.get(url.drivername)
+
+    return url.set(drivername=f"{url.drivername}+{driver}") if driver else url
+
+
+DATABASE_URL: URL = async_database_url(settings.DATABASE_URL)
+_IS_SQLITE: bool = DATABASE_URL.get_backend_name() == "sqlite"
+
+_PING: TextClause = text("SELECT 1")
+
+_SQLITE_PRAGMAS: tuple[str, ...] = (
+    "PRAGMA journal_mode=WAL",
+    "PRAGMA synchronous=NORMAL",
+    "PRAGMA temp_store=MEMORY",
+    "PRAGMA cache_size=-64000",
+)
 
 
 class Base(DeclarativeBase):
@@ -20,14 +48,28 @@ engine: AsyncEngine = create_async_engine(
     DATABASE_URL,
     echo=False,
     echo_pool=False,
-    pool_size=5,
-    max_overflow=10,
-    pool_timeout=30,
-    pool_recycle=1_800,
+    pool_size=settings.DB_POOL_SIZE,
+    max_overflow=settings.DB_MAX_OVERFLOW,
+    pool_timeout=settings.DB_POOL_TIMEOUT,
+    pool_recycle=-1 if _IS_SQLITE else 1_800,
+    pool_pre_ping=not _IS_SQLITE,
     future=True,
 )
 
 
+def _apply_sqlite_pragmas(dbapi_conn: Any, _: Any) -> None:
+    cursor = dbapi_conn.cursor()
+
+    for pragma in _SQLITE_PRAGMAS:
+        cursor.execute(pragma)
+
+    cursor.close()
+
+
+if _IS_SQLITE:
+    event.listen(engine.sync_engine, "connect", _apply_sqlite_pragmas)
+
+
 SessionLocal: async_sessionmaker[AsyncSession] = async_sessionmaker(
     bind=engine,
     class_=AsyncSession,
@@ -44,12 +86,22 @@ async def get_session() -> AsyncGenerator[AsyncSession, None]:
 async def init_db() -> None:
     from app.database.entities.item_orm import ItemORM  # type: ignore # noqa: F401
 
-    try:
-        async with engine.begin() as conn:
-            await conn.run_sync(Base.metadata.create_all)
+    async with engine.begin() as conn:
+        await conn.run_sync(Base.metadata.create_all)
+
+
+async def warm_pool(size: int) -> None:
+    results: list[AsyncConnection | BaseException] = await asyncio.gather(
+        *(engine.connect() for _ in range(size)), return_exceptions=True
+    )
+
+    await asyncio.gather(
+        *(conn.close() for conn in results if isinstance(conn, AsyncConnection))
+    )
 
-    except:
-        raise
+    for result in results:
+        if isinstance(result, BaseException):
+            raise result
 
 
 async def close_db() -> None:
@@ -59,7 +111,7 @@ async def close_db() -> None:
 async def db_test_query() -> bool:
     try:
         async with engine.connect() as conn:
-            await conn.execute(text("SELECT 1"))
+            await conn.execute(_PING)
 
         return True
 
@@ -69,9 +121,14 @@ async def db_test_query() -> bool:
 
 class DatabaseService:
     name: str = "database (sqlalchemy)"
+    depends_on: tuple[str, ...] = ()
 
     async def start(self):
         await init_db()
+        warm: int | None = settings.DB_POOL_WARM
+        await warm_pool(
+            settings.DB_POOL_SIZE if warm is None else min(warm, settings.DB_POOL_SIZE)
+        )
 
     async def stop(self):
         await close_db()
@@ -1,5 +1,6 @@
 import sys
-from typing import Literal, NoReturn
+from functools import lru_cache
+from typing import TYPE_CHECKING, Any, Literal, NoReturn
 
 from pydantic import Field, ValidationError
 from pydantic_core import ErrorDetails
@@ -17,19 +18,26 @@ class Settings(BaseSettings):
 
     HOST: str = "0.0.0.0"
     PORT: int = Field(..., ge=1, le=65_535)
+    WORKERS: int = Field(1, ge=1, le=64)
 
     DATABASE_URL: str = Field(..., min_length=5)
+    DB_POOL_SIZE: int = Field(20, ge=1, le=1_000)
+    DB_MAX_OVERFLOW: int = Field(30, ge=0, le=1_000)
+    DB_POOL_TIMEOUT: float = Field(30, gt=0, le=300)
+    DB_POOL_WARM: int | None = Field(None, ge=0, le=1_000)
 
     model_config = SettingsConfigDict(
         env_file=".env",
         env_file_encoding="utf-8",
         case_sensitive=True,
+        env_ignore_empty=True,
         validate_default=True,
         extra="ignore",
     )
 
 
-def load_settings() -> Settings:
+@lru_cache(maxsize=1)
+def get_settings() -> Settings:
     try:
         return Settings()  # type: ignore
 
@@ -51,12 +59,11 @@ def print_env_error_and_exit(err: ValidationError) -> NoReturn:
         f"\n{red}❌ {bold}Environment validation failed! ({len(errors)} issues){reset}\n"
     )
 
-    loc_names: list[str] = [
-        ".".join(str(x) for x in issue.get("loc", [])) for issue in errors
-    ]
-    max_len: int = max(len(name) for name in loc_names)
+    rows: list[tuple[str, str, str]] = []
+    max_len: int = 0
 
-    for issue, name in zip(errors, loc_names):
+    for issue in errors:
+        name: str = ".".join(str(x) for x in issue.get("loc", []))
         msg: str = issue.get("msg", "Invalid value")
 
         if issue.get("type") == "missing" or "input" not in issue:
@@ -64,6 +71,10 @@ def print_env_error_and_exit(err: ValidationError) -> NoReturn:
         else:
             received_repr = repr(issue["input"])
 
+        rows.append((name, msg, received_repr))
+        max_len = max(max_len, len(name))
+
+    for name, msg, received_repr in rows:
         print(
             f"  - {yellow}{name.ljust(max_len)}{reset}  → "
             f"{msg}, (received: {red}{received_repr}{reset})"
@@ -73,4 +84,12 @@ def print_env_error_and_exit(err: ValidationError) -> NoReturn:
     sys.exit(1)
 
 
-settings: Settings = load_settings()
+if TYPE_CHECKING:
+    settings: Settings
+
+
+def __getattr__(name: str) -> Any:
+    if name == "settings":
+        return get_settings()
+
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
@@ -1,20 +1,29 @@
+import atexit
 import logging
-import os
-import socket
-from typing import Any, Protocol, cast, runtime_checkable
+import queue
+import sys
+import time
+from logging.handlers import QueueHandler, QueueListener
+from typing import BinaryIO, cast
 
-import structlog
-from colorama import Fore, Style
-from structlog.typing import EventDict, WrappedLogger
+import orjson
 
-from app.config.environment import settings
+from app.common.store.request_context import RequestContext
+from app.config.environment import get_settings
+
+cyan = "\x1b[36m"
+green = "\x1b[32m"
+yellow = "\x1b[33m"
+red = "\x1b[31m"
+magenta = "\x1b[35m"
+white = "\x1b[37m"
 
 colors: dict[str, str] = {
-    "DEBUG": Fore.CYAN,
-    "INFO": Fore.GREEN,
-    "WARNING": Fore.YELLOW,
-    "ERROR": Fore.RED,
-    "CRITICAL": Fore.MAGENTA,
+    "DEBUG": cyan,
+    "INFO": green,
+    "WARNING": yellow,
+    "ERROR": red,
+    "CRITICAL": magenta,
 }
 
 LOG_LEVEL_MAP: dict[str, int] = {
@@ -25,30 +34,17 @@ LOG_LEVEL_MAP: dict[str, int] = {
 }
 
 dark_green = '\x1b[2m\x1b[32m'
-reset: str = Style.RESET_ALL
-
-
-def add_process_context(
-    _: WrappedLogger,
-    __: str,
-    event_dict: EventDict,
-) -> EventDict:
-    event_dict["pid"] = os.getpid()
-    event_dict["hostname"] = socket.gethostname()
-
-    return event_dict
-
+reset: str = "\x1b[0m"
 
-@runtime_checkable
-class LoggerProtocol(Protocol):
-    def debug(self, event: str, **kwargs: Any) -> None: ...
-    def info(self, event: str, **kwargs: Any) -> None: ...
-    def warning(self, event: str, **kwargs: Any) -> None: ...
-    def error(self, event: str, **kwargs: Any) -> None: ...
-    def critical(self, event: str, **kwargs: Any) -> None: ...
+_LEVEL_PREFIX: dict[str, str] = {
+    level: f"{color}[{level.lower().ljust(8)}]{reset}"
+    for level, color in colors.items()
+}
 
+_PLAIN_PREFIX: dict[str, str] = {
+    level: f"[{level.lower().ljust(8)}]" for level in colors
+}
 
-logging.basicConfig(format="%(message)s", level=logging.DEBUG)
 
 for noisy in (
     "uvicorn",
@@ -62,65 +58,153 @@ for noisy in (
     logging.getLogger(noisy).setLevel(logging.CRITICAL)
 
 
-def concise_renderer(_: WrappedLogger, __: str, event_dict: EventDict) -> str:
-    timestamp = event_dict.pop("timestamp", "")[:-3]
-    level = event_dict.pop("level", "")
-    message = event_dict.pop("event", "")
-    request_id = event_dict.pop("request_id", None)
-    pid = event_dict.pop("pid", None)
+class ConciseFormatter(logging.Formatter):
+
+    def __init__(self, colored: bool = True) -> None:
+        super().__init__()
+        self._second: int = -1
+        self._stamp: str = ""
+        self._pid: int | None = None
+        self._pid_tag: str = ""
+
+        self._levels: dict[str, str] = _LEVEL_PREFIX if colored else _PLAIN_PREFIX
+        self._fallback: str = f"{white}[%s]{reset}" if colored else "[%s]"
+        self._time_fmt: str = f"{dark_green}%s.%03d{reset}" if colored else "%s.%03d"
+        self._pid_fmt: str = f" {cyan}[%s]{reset}" if colored else " [%s]"
+        self._rid_fmt: str = f" {magenta}[%s]{reset}" if colored else " [%s]"
+
+    def _timestamp(self, created: float) -> str:
+        second: int = int(created)
+
+        if second != self._second:
+            self._second = second
+            self._stamp = time.strftime("%Y-%m-%d %H:%M:%S", time.localtime(second))
+
+        return self._stamp
+
+    def _process_tag(self, pid: int | None) -> str:
+        if pid != self._pid:
+            self._pid = pid
+            self._pid_tag = self._pid_fmt % pid
+
+        return self._pid_tag
+
+    def format(self, record: logging.LogRecord) -> str:
+        timestamp: str = self._time_fmt % (
+            self._timestamp(record.created),
+            int(record.msecs),
+        )
+        request_id: str | None = getattr(record, "request_id", None)
+
+        prefix: str | None = self._levels.get(record.levelname)
+        if prefix is None:
+            prefix = self._fallback % record.levelname.lower().ljust(8)
+
+        rid: str = self._rid_fmt % request_id if request_id else ""
+
+        line: str = (
+            f"{timestamp}{self._process_tag(record.process)}"
+            f" {prefix}{rid} {record.getMessage()}"
+        )
+
+        if record.exc_info:
+            line += "\n" + self.formatException(record.exc_info)
+
+        return line
+
+
+class JSONFormatter(logging.Formatter):
+
+    def format(self, record: logging.LogRecord) -> str:
+        return self.format_bytes(record)[:-1].decode()
+
+    def format_bytes(self, record: logging.LogRecord) -> bytes:
+        payload: dict[str, object] = {
+            "timestamp": round(record.created, 3),
+            "level": record.levelname.lower(),
+            "pid": record.process,
+            "message": record.getMessage(),
+        }
+
+        request_id: str | None = getattr(record, "request_id", None)
+
+        if request_id:
+            payload["request_id"] = request_id
+
+        if record.exc_info:
+            payload["exception"] = self.formatException(record.exc_info)
+
+        return orjson.dumps(payload, option=orjson.OPT_APPEND_NEWLINE)
+
+
+class BytesStreamHandler(logging.Handler):
+
+    def __init__(self, stream: BinaryIO, formatter: JSONFormatter) -> None:
+        super().__init__()
+        self.stream = stream
+        self.json_formatter = formatter
+        self.setFormatter(formatter)
+
+    def emit(self, record: logging.LogRecord) -> None:
+        try:
+            self.stream.write(self.json_formatter.format_bytes(record))
+            self.stream.flush()
+
+        except Exception:
+            self.handleError(record)
+
+
+class ContextQueueHandler(QueueHandler):
+
+    def prepare(self, record: logging.LogRecord) -> logging.LogRecord:
+        ctx = RequestContext.get()
+        record.request_id = ctx.request_id if ctx is not None else None
 
-    line: str = f"{dark_green}{timestamp}{reset}"
+        if record.exc_info or record.stack_info:
+            return cast(logging.LogRecord, super().prepare(record))
 
-    if pid:
-        line += f" {Fore.CYAN}[{pid}]{reset}"
+        if record.args:
+            record.msg = record.getMessage()
+            record.args = None
 
-    color: str = colors.get(level.upper(), Fore.WHITE)
+        return record
 
-    line += f" {color}[{level.ljust(8)}]{reset}"
 
-    if request_id:
-        line += f" {Fore.MAGENTA}[{request_id}]{reset}"
+_queue: queue.SimpleQueue[logging.LogRecord] = queue.SimpleQueue()
 
-    line += f" {message}"
+_handler: logging.Handler
 
-    return line
+if get_settings().ENV == "production":
+    _handler = BytesStreamHandler(sys.stdout.buffer, JSONFormatter())
 
+else:
+    _handler = logging.StreamHandler(sys.stdout)
+    _handler.setFormatter(ConciseFormatter(colored=sys.stdout.isatty()))
 
-structlog.configure(
-    processors=[
-        structlog.contextvars.merge_contextvars,
-        add_process_context,
-        structlog.processors.add_log_level,
-        structlog.processors.TimeStamper(fmt="%Y-%m-%d %H:%M:%S.%f", utc=False),
-        concise_renderer,
-    ],
-    wrapper_class=structlog.make_filtering_bound_logger(
-        LOG_LEVEL_MAP.get(settings.LOG_LEVEL, logging.INFO)
-    ),
-    logger_factory=structlog.stdlib.LoggerFactory(),
-    cache_logger_on_first_use=True,
-)
+_listener: QueueListener = QueueListener(_queue, _handler, respect_handler_level=True)
+_listening: bool = False
 
 
-class _LogProxy(LoggerProtocol):
-    def __getattribute__(self, name: str):
-        logger = structlog.get_logger()
-        return getattr(logger, name)
+def start_log_listener() -> None:
+    global _listening
 
-    def debug(self, event: str, **kwargs: Any) -> None:
-        raise NotImplementedError
+    if not _listening:
+        _listener.start()
+        _listening = True
 
-    def info(self, event: str, **kwargs: Any) -> None:
-        raise NotImplementedError
 
-    def warning(self, event: str, **kwargs: Any) -> None:
-        raise NotImplementedError
+def stop_log_listener() -> None:
+    global _listening
 
-    def error(self, event: str, **kwargs: Any) -> None:
-        raise NotImplementedError
+    if _listening:
+        _listener.stop()
+        _listening = False
 
-    def critical(self, event: str, **kwargs: Any) -> None:
-        raise NotImplementedError
 
+log: logging.Logger = logging.getLogger("app")
+log.handlers = [ContextQueueHandler(_queue)]
+log.propagate = False
+log.setLevel(LOG_LEVEL_MAP.get(get_settings().LOG_LEVEL, logging.INFO))
 
-log: LoggerProtocol = cast(LoggerProtocol, _LogProxy())
+start_log_listener()
+atexit.register(stop_log_listener)
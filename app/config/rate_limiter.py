@@ -1,9 +1,20 @@
 from __future__ import annotations
 
-from time import monotonic
+from collections import OrderedDict
+from collections.abc import Awaitable
+from time import monotonic_ns
+from typing import Protocol
 
 from app.common.store.rate_limit import RateLimitState
 
+_NS: int = 1_000_000_000
+_MILLI: int = 1_000
+_SHARDS: int = 16
+
+
+class RateLimitBackend(Protocol):
+    def allow(self, ip: str) -> bool | Awaitable[bool]: ...
+
 
 class RateLimiter:
     def __init__(
@@ -20,65 +31,78 @@ class RateLimiter:
         self.sustained_period = sustained_period
         self.gc_interval = gc_interval
 
-        self._clients: dict[str, RateLimitState] = {}
-        self._last_gc = monotonic()
+        self._burst_window_ns: int = int(burst_window * _NS)
+        self._gc_step_ns: int = int(gc_interval * _NS) // _SHARDS
+        self._idle_cutoff_ns: int = int(sustained_period * 2 * _NS)
 
-    def _get_state(self, ip: str) -> RateLimitState:
-        state: RateLimitState | None = self._clients.get(ip)
+        self._sustained_cap: int = max_sustained * _MILLI
+        self._ns_per_milli: int = max(
+            1, int(sustained_period * _NS) // max(1, self._sustained_cap)
+        )
+
+        self._shards: list[OrderedDict[str, RateLimitState]] = [
+            OrderedDict() for _ in range(_SHARDS)
+        ]
+        self._gc_cursor: int = 0
+        self._last_gc_ns: int = monotonic_ns()
+
+    def _get_state(self, ip: str, now_ns: int) -> RateLimitState:
+        shard: OrderedDict[str, RateLimitState] = self._shards[hash(ip) & (_SHARDS - 1)]
+        state: RateLimitState | None = shard.get(ip)
 
         if state is None:
-            state = RateLimitState.new(self.max_burst, self.max_sustained)
-            self._clients[ip] = state
+            state = RateLimitState.new(self.max_burst, self._sustained_cap, now_ns)
+            shard[ip] = state
+
+        else:
+            shard.move_to_end(ip)
 
         return state
 
-    def _refill(self, state: RateLimitState) -> None:
-        now: float = monotonic()
-        elapsed: float = now - state.last_refill
+    def _refill(self, state: RateLimitState, now_ns: int) -> None:
+        added: int = (now_ns - state.last_refill_ns) // self._ns_per_milli
 
-        if elapsed > 0:
-            refill_rate = self.max_sustained / self.sustained_period
-            state.last_refill = now
-            state.sustained_tokens = min(
-                self.max_sustained,
-                state.sustained_tokens + elapsed * refill_rate,
+        if added:
+            tokens: int = state.sustained_milli + added
+            state.sustained_milli = (
+                tokens if tokens < self._sustained_cap else self._sustained_cap
             )
+            state.last_refill_ns += added * self._ns_per_milli
 
-        if (now - state.last_burst_reset) >= self.burst_window:
+        if (now_ns - state.last_burst_reset_ns) >= self._burst_window_ns:
             state.burst_tokens = self.max_burst
-            state.last_burst_reset = now
+            state.last_burst_reset_ns = now_ns
 
-        state.last_seen = now
+        state.last_seen_ns = now_ns
 
-    def _gc(self) -> None:
-        now: float = monotonic()
-
-        if (now - self._last_gc) < self.gc_interval:
+    def _gc(self, now_ns: int) -> None:
+        if (now_ns - self._last_gc_ns) < self._gc_step_ns:
             return
 
-        cutoff: float = self.sustained_period * 2
-        to_delete: list[str] = [
-            ip for ip, s in self._clients.items() if (now - s.last_seen) > cutoff
-        ]
+        shard: OrderedDict[str, RateLimitState] = self._shards[self._gc_cursor]
+        self._gc_cursor = (self._gc_cursor + 1) & (_SHARDS - 1)
 
-        for ip in to_delete:
-            del self._clients[ip]
+        while shard:
+            oldest: RateLimitState = next(iter(shard.values()))
 
-        self._last_gc = now
+            if (now_ns - oldest.last_seen_ns) <= self._idle_cutoff_ns:
+                break
 
-    def allow(self, ip: str) -> bool:
-        state: RateLimitState = self._get_state(ip)
+            shard.popitem(last=False)
 
-        self._refill(state)
-        self._gc()
+        self._last_gc_ns = now_ns
 
-        if state.burst_tokens < 1:
-            return False
+    def allow(self, ip: str) -> bool:
+        now_ns: int = monotonic_ns()
+        state: RateLimitState = self._get_state(ip, now_ns)
+
+        self._refill(state, now_ns)
+        self._gc(now_ns)
 
-        if state.sustained_tokens < 1:
+        if state.burst_tokens < 1 or state.sustained_milli < _MILLI:
             return False
 
         state.burst_tokens -= 1
-        state.sustained_tokens -= 1
+        state.sustained_milli -= _MILLI
 
         return True
@@ -1,4 +1,5 @@
-from datetime import datetime
+from datetime import UTC, datetime
+from typing import Any
 from uuid import uuid4
 
 from sqlalchemy import DateTime, String
@@ -12,8 +13,13 @@ def generate_id() -> str:
     return uuid4().hex[:16]
 
 
+def utc_now() -> datetime:
+    return datetime.now(UTC)
+
+
 class BaseEntity(Base):
     __abstract__ = True
+    __mapper_args__: dict[str, Any] = {"eager_defaults": True}  # noqa: RUF012
 
     id: Mapped[str] = mapped_column(
         String(16),
@@ -32,7 +38,8 @@ class BaseEntity(Base):
     updated_at: Mapped[datetime] = mapped_column(
         "updatedAt",
         DateTime(timezone=True),
+        default=utc_now,
         server_default=func.now(),
-        onupdate=func.now(),
+        onupdate=utc_now,
         doc="Timestamp when the record was last updated (UTC).",
     )
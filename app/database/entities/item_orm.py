@@ -1,4 +1,4 @@
-from sqlalchemy import Numeric, String, Text
+from sqlalchemy import DDL, Index, Numeric, String, Text, event
 from sqlalchemy.orm import Mapped, mapped_column
 
 from app.database.entities.base_orm import BaseEntity
@@ -6,6 +6,21 @@ from app.database.entities.base_orm import BaseEntity
 
 class ItemORM(BaseEntity):
     __tablename__ = "items"
+    __table_args__ = (
+        Index("ix_items_createdAt", "createdAt"),
+        Index(
+            "ix_items_name_trgm",
+            "name",
+            postgresql_using="gin",
+            postgresql_ops={"name": "gin_trgm_ops"},
+        ).ddl_if(dialect="postgresql"),
+        Index(
+            "ix_items_description_trgm",
+            "description",
+            postgresql_using="gin",
+            postgresql_ops={"description": "gin_trgm_ops"},
+        ).ddl_if(dialect="postgresql"),
+    )
 
     name: Mapped[str] = mapped_column(
         String(120),
@@ -15,7 +30,8 @@ class ItemORM(BaseEntity):
     )
 
     price: Mapped[float] = mapped_column(
-        Numeric(10, 2),
+        Numeric(10, 2, asdecimal=False),
+        index=True,
         nullable=False,
         doc="Price of the item represented as a decimal with 2 fractional digits.",
     )
@@ -25,3 +41,10 @@ class ItemORM(BaseEntity):
         nullable=True,
         doc="Optional free-text description of the item; null when not provided.",
     )
+
+
+event.listen(
+    ItemORM.__table__,
+    "before_create",
+    DDL("CREATE EXTENSION IF NOT EXISTS pg_trgm").execute_if(dialect="postgresql"),
+)
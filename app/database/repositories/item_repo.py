@@ -1,10 +1,28 @@
-from collections.abc import Sequence
+from collections.abc import AsyncIterator, Sequence
 from dataclasses import dataclass
+from datetime import datetime
 from enum import StrEnum
-from typing import NotRequired, TypedDict
-
-from sqlalchemy import ColumnElement, Result, Select, func, or_, select
-from sqlalchemy.ext.asyncio import AsyncSession
+from typing import Any, NotRequired, TypedDict, cast
+
+from sqlalchemy import (
+    ColumnElement,
+    CursorResult,
+    Delete,
+    Insert,
+    Result,
+    Row,
+    Select,
+    UnaryExpression,
+    Update,
+    bindparam,
+    delete,
+    func,
+    insert,
+    or_,
+    select,
+    update,
+)
+from sqlalchemy.ext.asyncio import AsyncResult, AsyncSession
 
 from app.database.entities.item_orm import ItemORM
 from app.models.parameters_model import HexId
@@ -23,7 +41,7 @@ class ItemUpdateData(TypedDict, total=False):
 
 
 class ItemSort(StrEnum):
-    CREATED_AT = "createdAt"
+    CREATED_AT = "created_at"
     ITEM_NAME = "name"
     PRICE = "price"
 
@@ -33,6 +51,47 @@ class SortOrder(StrEnum):
     desc = "desc"
 
 
+ItemColumns = tuple[str, str, float, str | None, datetime, datetime]
+ItemRow = Row[ItemColumns]
+ItemPageColumns = tuple[str, str, float, str | None, datetime, datetime, int]
+ItemPageRow = Row[ItemPageColumns]
+
+_LIST_COLUMNS = (
+    ItemORM.id,
+    ItemORM.name,
+    ItemORM.price,
+    ItemORM.description,
+    ItemORM.created_at,
+    ItemORM.updated_at,
+)
+
+_SORT: dict[tuple[ItemSort, SortOrder], UnaryExpression[Any]] = {
+    (sort, order): (
+        getattr(ItemORM, sort).desc()
+        if order is SortOrder.desc
+        else getattr(ItemORM, sort).asc()
+    )
+    for sort in ItemSort
+    for order in SortOrder
+}
+
+_STREAM_ALL: Select[ItemColumns] = select(*_LIST_COLUMNS).execution_options(
+    yield_per=500
+)
+
+_FINGERPRINT: Select[tuple[int, datetime | None]] = select(
+    func.count(), func.max(ItemORM.updated_at)
+)
+
+_INSERT: Insert = insert(ItemORM).returning(ItemORM)
+
+_UPDATE_BY_ID: Update = (
+    update(ItemORM).where(ItemORM.id == bindparam("item_id")).returning(ItemORM)
+)
+
+_DELETE_BY_ID: Delete = delete(ItemORM).where(ItemORM.id == bindparam("item_id"))
+
+
 @dataclass(frozen=True, slots=True)
 class ItemListQuery:
     limit: int
@@ -48,22 +107,24 @@ class ItemRepository:
     async def create(
         self, session: AsyncSession, *, item_in: ItemCreateData
     ) -> ItemORM:
-        item: ItemORM = ItemORM(**item_in)
-        session.add(item)
+        result: Result[tuple[ItemORM]] = await session.execute(
+            _INSERT.values(**item_in)
+        )
+        item: ItemORM = result.scalar_one()
 
         await session.commit()
-        await session.refresh(item)
 
         return item
 
-    async def get_all(self, session: AsyncSession) -> Sequence[ItemORM]:
-        result: Result[tuple[ItemORM]] = await session.execute(select(ItemORM))
+    async def get_all(self, session: AsyncSession) -> AsyncIterator[ItemRow]:
+        result: AsyncResult[ItemColumns] = await session.stream(_STREAM_ALL)
 
-        return result.scalars().all()
+        async for row in result:
+            yield row
 
     async def find_and_count(
         self, session: AsyncSession, payload: ItemListQuery
-    ) -> tuple[Sequence[ItemORM], int]:
+    ) -> tuple[Sequence[ItemPageRow], int]:
         filters: list[ColumnElement[bool]] = []
 
         if payload.search:
@@ -81,56 +142,69 @@ class ItemRepository:
         if payload.max_price is not None:
             filters.append(ItemORM.price <= payload.max_price)
 
-        sort_column = getattr(ItemORM, payload.sort)
-        sort_expr = sort_column.desc() if payload.order == "desc" else sort_column.asc()
+        sort_expr: UnaryExpression[Any] = _SORT[(payload.sort, payload.order)]
 
-        base_query: Select[tuple[ItemORM]] = (
-            select(ItemORM).where(*filters).order_by(sort_expr)
+        data_query: Select[ItemPageColumns] = (
+            select(*_LIST_COLUMNS, func.count().over().label("total"))
+            .where(*filters)
+            .order_by(sort_expr)
+            .offset(payload.offset)
+            .limit(payload.limit)
         )
 
-        count_query: Select[tuple[int]] = select(func.count()).select_from(
-            base_query.subquery()
-        )
+        data: Sequence[ItemPageRow] = (await session.execute(data_query)).all()
 
-        data_query: Select[tuple[ItemORM]] = base_query.offset(payload.offset).limit(
-            payload.limit
+        if data:
+            return data, data[0].total
+
+        if payload.offset == 0:
+            return data, 0
+
+        count_query: Select[tuple[int]] = (
+            select(func.count()).select_from(ItemORM).where(*filters)
         )
 
-        total: int = await session.scalar(count_query) or 0
-        data: Sequence[ItemORM] = (await session.execute(data_query)).scalars().all()
+        return data, await session.scalar(count_query) or 0
 
-        return data, total
+    async def fingerprint(self, session: AsyncSession) -> tuple[int, datetime | None]:
+        row: Row[tuple[int, datetime | None]] = (
+            await session.execute(_FINGERPRINT)
+        ).one()
 
-    async def get_by_id(self, session: AsyncSession, id: HexId) -> ItemORM | None:
-        result: Result[tuple[ItemORM]] = await session.execute(
-            select(ItemORM).where(ItemORM.id == id)
-        )
+        return row[0], row[1]
 
-        return result.scalar_one_or_none()
+    async def get_by_id(self, session: AsyncSession, id: HexId) -> ItemORM | None:
+        return await session.get(ItemORM, id)
 
     async def update(
         self,
         session: AsyncSession,
-        obj: ItemORM,
+        id: HexId,
         new_data: ItemUpdateData,
-    ) -> ItemORM:
-        for field, value in new_data.items():
-            setattr(obj, field, value)
+    ) -> ItemORM | None:
+        result: Result[tuple[ItemORM]] = await session.execute(
+            _UPDATE_BY_ID.values(**new_data), {"item_id": id}
+        )
+        updated: ItemORM | None = result.scalar_one_or_none()
 
         await session.commit()
-        await session.refresh(obj)
 
-        return obj
+        return updated
 
     async def delete(
         self,
         session: AsyncSession,
-        obj: ItemORM,
-    ) -> ItemORM:
-        await session.delete(obj)
+        id: HexId,
+    ) -> bool:
+        result: CursorResult[Any] = cast(
+            CursorResult[Any],
+            await session.execute(_DELETE_BY_ID, {"item_id": id}),
+        )
+        removed: bool = result.rowcount > 0
+
         await session.commit()
 
-        return obj
+        return removed
 
 
 repo: ItemRepository = ItemRepository()
@@ -1,21 +1,29 @@
 import sys
+from typing import Any
 
 import uvicorn
 
 from app.config.environment import settings
-
-red = "\033[91m"
-bold = "\033[1m"
+from app.config.logging import log
 
 
 def main() -> None:
-    uvicorn.run(
-        "app.config.application:app",
-        host=settings.HOST,
-        port=settings.PORT,
-        reload=(settings.ENV == "development"),
-        log_config=None,
-    )
+    options: dict[str, Any] = {
+        "host": settings.HOST,
+        "port": settings.PORT,
+        "loop": "asyncio" if sys.platform == "win32" else "uvloop",
+        "http": "httptools",
+        "access_log": False,
+        "log_config": None,
+    }
+
+    if settings.ENV == "development":
+        options["reload"] = True
+
+    else:
+        options["workers"] = settings.WORKERS
+
+    uvicorn.run("app.config.application:app", **options)
 
 
 if __name__ == "__main__":
@@ -23,8 +31,8 @@ if __name__ == "__main__":
         main()
 
     except Exception:
-        print(
-            f"{red}❌ {bold}Fatal error during server initialization — forcing exit\n"
+        log.critical(
+            "Fatal error during server initialization — forcing exit", exc_info=True
         )
 
         sys.exit(1)
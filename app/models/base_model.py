@@ -1,7 +1,7 @@
 from datetime import UTC, datetime
 from uuid import uuid4
 
-from pydantic import BaseModel, Field
+from pydantic import BaseModel, ConfigDict, Field
 
 
 class BaseResponse(BaseModel):
@@ -26,5 +26,6 @@ class BaseResponse(BaseModel):
         examples=[datetime(2025, 1, 1, 12, 5, 0, tzinfo=UTC).isoformat()],
     )
 
-    class Config:
-        from_attributes = True
+    model_config = ConfigDict(
+        from_attributes=True, extra="ignore", validate_default=False
+    )
@@ -1,8 +1,8 @@
-from datetime import UTC, datetime
+import time
 from typing import Any
 
-from fastapi import status
-from fastapi.responses import JSONResponse
+import orjson
+from fastapi import Response, status
 from pydantic import BaseModel, Field
 
 
@@ -24,23 +24,45 @@ class ErrorResponse(BaseModel):
     )
 
 
+def _error_prefix(status: int, message: str) -> bytes:
+    return b'{"status":%d,"message":%s,"timestamp":' % (status, orjson.dumps(message))
+
+
+_COMMON_ERROR_PREFIXES: dict[tuple[int, str], bytes] = {
+    (code, message): _error_prefix(code, message)
+    for code, message in (
+        (404, "Not Found"),
+        (405, "Method Not Allowed"),
+        (408, "Request header timeout exceeded."),
+        (408, "Request chunk timeout exceeded."),
+        (408, "Total request timeout exceeded."),
+        (415, "Missing Content-Type header."),
+        (429, "Too many requests — please slow down."),
+        (500, "Internal server error."),
+        (503, "Application not ready."),
+    )
+}
+
+
+def error_body(status: int, message: str) -> bytes:
+    prefix: bytes | None = _COMMON_ERROR_PREFIXES.get((status, message))
+
+    if prefix is None:
+        prefix = _error_prefix(status, message)
+
+    return b"%s%d}" % (prefix, time.time_ns() // 1_000_000)
+
+
 def error_response(
     status: int,
     message: str,
     headers: dict[str, str] | None = None,
-) -> JSONResponse:
-    ts_ms: int = int(datetime.now(UTC).timestamp() * 1_000)
-
-    model: ErrorResponse = ErrorResponse(
-        status=status,
-        message=message,
-        timestamp=ts_ms,
-    )
-
-    return JSONResponse(
+) -> Response:
+    return Response(
+        content=error_body(status, message),
         status_code=status,
-        content=model.model_dump(),
-        headers=headers or {},
+        media_type="application/json",
+        headers=headers,
     )
 
 
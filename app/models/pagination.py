@@ -1,7 +1,7 @@
 from collections.abc import Sequence
 from typing import Literal, TypeVar
 
-from pydantic import BaseModel, Field
+from pydantic import BaseModel, ConfigDict, Field, computed_field
 
 T = TypeVar("T")
 
@@ -21,10 +21,10 @@ class PaginationQuery(BaseModel):
         examples=["sword"],
     )
 
-    # @computed_field(return_type=int)
-    # @property
-    # def offset(self) -> int:
-    #     return (self.page - 1) * self.limit
+    @computed_field(return_type=int)  # type: ignore[prop-decorator]
+    @property
+    def offset(self) -> int:
+        return (self.page - 1) * self.limit
 
     model_config = {"frozen": True}
 
@@ -58,5 +58,4 @@ class PaginatedResult[T](BaseModel):
             return 1
         return max((self.total + self.limit - 1) // self.limit, 1)
 
-    class Config:
-        frozen = True
+    model_config = ConfigDict(frozen=True)
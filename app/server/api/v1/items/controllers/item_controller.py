@@ -1,4 +1,10 @@
-from fastapi import APIRouter, Depends, HTTPException, status
+import zlib
+from datetime import datetime
+from typing import cast
+
+from fastapi import APIRouter, Depends, HTTPException, Request, Response, status
+from pydantic import TypeAdapter
+from pydantic_core import SchemaSerializer
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from app.config.database import get_session
@@ -19,6 +25,39 @@ from app.server.api.v1.items.models.pagination_query_model import ItemPagination
 
 router: APIRouter = APIRouter()
 
+_ITEMS_ADAPTER: TypeAdapter[list[ItemResponse]] = TypeAdapter(list[ItemResponse])
+
+_PAGE_SERIALIZER: SchemaSerializer = PaginatedResult[
+    ItemResponse
+].__pydantic_serializer__
+
+
+def _to_response(obj: ItemORM) -> ItemResponse:
+    return ItemResponse.model_construct(
+        id=obj.id,
+        name=obj.name,
+        price=float(obj.price),
+        description=obj.description,
+        created_at=obj.created_at,
+        updated_at=obj.updated_at,
+    )
+
+
+def _list_etag(request: Request, count: int, last_update: datetime | None) -> str:
+    stamp: str = last_update.isoformat() if last_update else "0"
+    params: int = zlib.crc32(request.url.query.encode())
+
+    return f'W/"{count}-{stamp}-{params:08x}"'
+
+
+def _etag_matches(request: Request, etag: str) -> bool:
+    header: str | None = request.headers.get("if-none-match")
+
+    if not header:
+        return False
+
+    return header.strip() == "*" or etag in (t.strip() for t in header.split(","))
+
 
 ## POST /
 @router.post(
@@ -31,9 +70,11 @@ router: APIRouter = APIRouter()
 async def create(
     payload: ItemBase, db: AsyncSession = Depends(get_session)
 ) -> ItemResponse:
-    created: ItemORM = await repo.create(db, item_in=model_to(ItemCreateData, payload))
+    created: ItemORM = await repo.create(
+        db, item_in=cast(ItemCreateData, payload.model_dump())
+    )
 
-    return ItemResponse.model_validate(created)
+    return _to_response(created)
 
 
 ## GET /
@@ -43,19 +84,39 @@ async def create(
     description="Retrieves a paginated list of items. Supports page, limit, sorting, and optional filtering.",
     response_model=PaginatedResult[ItemResponse],
     status_code=status.HTTP_200_OK,
+    responses={
+        status.HTTP_304_NOT_MODIFIED: {
+            "description": "The collection is unchanged since the ETag sent in If-None-Match.",
+        }
+    },
 )
 async def get_all(
-    query: ItemPaginationQuery = Depends(), db: AsyncSession = Depends(get_session)
-) -> PaginatedResult[ItemResponse]:
+    request: Request,
+    query: ItemPaginationQuery = Depends(),
+    db: AsyncSession = Depends(get_session),
+) -> Response:
+    etag: str = _list_etag(request, *await repo.fingerprint(db))
+
+    if _etag_matches(request, etag):
+        return Response(
+            status_code=status.HTTP_304_NOT_MODIFIED, headers={"ETag": etag}
+        )
+
     items, count = await repo.find_and_count(db, model_to(ItemListQuery, query))
 
-    return PaginatedResult[ItemResponse](
-        data=[ItemResponse.model_validate(item) for item in items],
+    page: PaginatedResult[ItemResponse] = PaginatedResult[ItemResponse].model_construct(
+        data=_ITEMS_ADAPTER.validate_python(items, from_attributes=True),
         total=count,
         page=query.page,
         limit=query.limit,
     )
 
+    return Response(
+        content=_PAGE_SERIALIZER.to_json(page),
+        media_type="application/json",
+        headers={"ETag": etag},
+    )
+
 
 ## GET /:id
 @router.get(
@@ -80,7 +141,7 @@ async def get(id: HexId, db: AsyncSession = Depends(get_session)) -> ItemRespons
             detail=f"Resource with ID '{id}' not found",
         )
 
-    return ItemResponse.model_validate(found)
+    return _to_response(found)
 
 
 ## PATCH /:id
@@ -100,19 +161,17 @@ async def get(id: HexId, db: AsyncSession = Depends(get_session)) -> ItemRespons
 async def update(
     id: HexId, payload: UpdateItemRequest, db: AsyncSession = Depends(get_session)
 ) -> ItemResponse:
-    obj: ItemORM | None = await repo.get_by_id(db, id)
+    updated: ItemORM | None = await repo.update(
+        db, id, cast(ItemUpdateData, payload.model_dump(exclude_unset=True))
+    )
 
-    if not obj:
+    if not updated:
         raise HTTPException(
             status_code=status.HTTP_404_NOT_FOUND,
             detail=f"Resource with ID '{id}' not found.",
         )
 
-    updated: ItemORM = await repo.update(
-        db, obj, model_to(ItemUpdateData, payload, exclude_unset=False)
-    )
-
-    return ItemResponse.model_validate(updated)
+    return _to_response(updated)
 
 
 ## PUT /:id
@@ -132,28 +191,26 @@ async def update(
 async def replace(
     id: HexId, payload: ItemBase, db: AsyncSession = Depends(get_session)
 ) -> ItemResponse:
-    obj: ItemORM | None = await repo.get_by_id(db, id)
+    updated: ItemORM | None = await repo.update(
+        db, id, cast(ItemUpdateData, payload.model_dump())
+    )
 
-    if not obj:
+    if not updated:
         raise HTTPException(
             status_code=status.HTTP_404_NOT_FOUND,
             detail=f"Resource with ID '{id}' not found.",
         )
 
-    updated: ItemORM = await repo.update(
-        db, obj, model_to(ItemUpdateData, payload, exclude_unset=False)
-    )
-
-    return ItemResponse.model_validate(updated)
+    return _to_response(updated)
 
 
 ## DELETE /:id
 @router.delete(
     "/{id}",
     summary="Delete an item by ID",
-    description="Removes an item by its ID. Returns the deleted resource for confirmation. Returns 404 if the item is not found.",
-    response_model=ItemResponse,
-    status_code=status.HTTP_200_OK,
+    description="Removes an item by its ID. Returns an empty 204 response on success and 404 if the item is not found.",
+    response_class=Response,
+    status_code=status.HTTP_204_NO_CONTENT,
     responses={
         status.HTTP_404_NOT_FOUND: {
             "description": "No item exists with the provided identifier.",
@@ -161,15 +218,13 @@ async def replace(
         },
     },
 )
-async def delete(id: HexId, db: AsyncSession = Depends(get_session)) -> ItemResponse:
-    obj: ItemORM | None = await repo.get_by_id(db, id)
+async def delete(id: HexId, db: AsyncSession = Depends(get_session)) -> Response:
+    removed: bool = await repo.delete(db, id)
 
-    if not obj:
+    if not removed:
         raise HTTPException(
             status_code=status.HTTP_404_NOT_FOUND,
             detail=f"Resource with ID '{id}' not found.",
         )
 
-    removed: ItemORM = await repo.delete(db, obj)
-
-    return ItemResponse.model_validate(removed)
+    return Response(status_code=status.HTTP_204_NO_CONTENT)
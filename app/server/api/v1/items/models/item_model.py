@@ -1,4 +1,4 @@
-from pydantic import BaseModel, Field
+from pydantic import BaseModel, ConfigDict, Field
 
 from app.models.base_model import BaseResponse
 
@@ -26,6 +26,10 @@ class ItemBase(BaseModel):
         examples=["A finely crafted steel blade."],
     )
 
+    model_config = ConfigDict(
+        from_attributes=True, extra="ignore", validate_default=False
+    )
+
 
 class ItemResponse(ItemBase, BaseResponse):
     pass
@@ -1,11 +1,13 @@
+import asyncio
 import os
 import socket
 import time
-from datetime import UTC, datetime
 from typing import Literal
 
+import orjson
 from fastapi import APIRouter, HTTPException, Response, status
 from prometheus_client import CONTENT_TYPE_LATEST, generate_latest
+from starlette.types import Receive, Scope, Send
 
 from app.common.handlers.lifecycle_handler import lifecycle
 from app.config.environment import settings
@@ -15,9 +17,103 @@ from app.server.system.models.live_model import HealthResponse
 from app.server.system.models.ready_model import ReadyResponse
 from app.server.system.models.root_model import RootResponse
 from app.server.system.models.system_model import SystemResponse
+from app.server.system.services.event_loop_lag_service import (
+    get_event_loop_lag,
+    get_lag_stats,
+)
+from app.server.system.services.uptime_service import get_uptime
 
 router: APIRouter = APIRouter(tags=["System"])
-_start_time: float = time.perf_counter()
+
+_READY_BODY: bytes = orjson.dumps({"ready": True})
+
+_ROOT_BODY: bytes = orjson.dumps(
+    RootResponse(message="Hello World! Welcome to FastAPI!").model_dump(mode="json")
+)
+
+_INFO_BODY: bytes = orjson.dumps(
+    InfoResponse(
+        name=settings.APP_NAME,
+        version=settings.APP_VERSION,
+        environment=settings.ENV,
+        hostname=socket.gethostname(),
+        pid=os.getpid(),
+    ).model_dump(mode="json")
+)
+
+_LIVE_TEMPLATE: str = '{"alive":%s,"uptime":%r,"timestamp":"%s"}'
+_live_cache: tuple[int, bool, bytes] = (-1, False, b"")
+
+_READY_TTL: float = 5.0
+_ready_cache: tuple[float, bool] | None = None
+_ready_lock: asyncio.Lock = asyncio.Lock()
+
+
+async def _services_healthy() -> bool:
+    global _ready_cache
+
+    cached: tuple[float, bool] | None = _ready_cache
+    if cached is not None and time.monotonic() - cached[0] < _READY_TTL:
+        return cached[1]
+
+    async with _ready_lock:
+        cached = _ready_cache
+        if cached is not None and time.monotonic() - cached[0] < _READY_TTL:
+            return cached[1]
+
+        healthy: bool = await lifecycle.are_all_services_healthy()
+        _ready_cache = (time.monotonic(), healthy)
+
+        return healthy
+
+
+def _json(body: bytes) -> Response:
+    return Response(content=body, media_type="application/json")
+
+
+def _iso_utc(second: int) -> str:
+    t: time.struct_time = time.gmtime(second)
+
+    return (
+        f"{t.tm_year:04d}-{t.tm_mon:02d}-{t.tm_mday:02d}"
+        f"T{t.tm_hour:02d}:{t.tm_min:02d}:{t.tm_sec:02d}Z"
+    )
+
+
+def _live_body() -> bytes:
+    global _live_cache
+
+    second: int = int(time.time())
+    alive: bool = lifecycle.is_alive()
+
+    cached_second, cached_alive, cached_body = _live_cache
+    if cached_second == second and cached_alive is alive:
+        return cached_body
+
+    uptime: float = int(get_uptime() * 1_000) / 1_000
+    body: bytes = (
+        _LIVE_TEMPLATE % ("true" if alive else "false", uptime, _iso_utc(second))
+    ).encode()
+
+    _live_cache = (second, alive, body)
+
+    return body
+
+
+async def live_asgi(scope: Scope, receive: Receive, send: Send) -> None:
+    body: bytes = _live_body()
+
+    await send(
+        {
+            "type": "http.response.start",
+            "status": status.HTTP_200_OK,
+            "headers": [
+                (b"content-type", b"application/json"),
+                (b"content-length", str(len(body)).encode()),
+            ],
+        }
+    )
+    await send({"type": "http.response.body", "body": body})
 
 
 ## GET /
@@ -28,8 +124,8 @@ _start_time: float = time.perf_counter()
     response_model=RootResponse,
     status_code=status.HTTP_200_OK,
 )
-async def root() -> RootResponse:
-    return RootResponse(message="Hello World! Welcome to FastAPI!")
+async def root() -> Response:
+    return _json(_ROOT_BODY)
 
 
 ## GET /health
@@ -40,12 +136,8 @@ async def root() -> RootResponse:
     response_model=HealthResponse,
     status_code=status.HTTP_200_OK,
 )
-async def live_probe() -> HealthResponse:
-    alive: bool = lifecycle.is_alive()
-    timestamp: str = datetime.now(UTC).isoformat()
-    uptime: float = round(time.perf_counter() - _start_time, 3)
-
-    return HealthResponse(alive=alive, uptime=uptime, timestamp=timestamp)
+async def live_probe() -> Response:
+    return _json(_live_body())
 
 
 ## GET /ready
@@ -62,17 +154,17 @@ async def live_probe() -> HealthResponse:
         }
     },
 )
-async def ready_probe() -> ReadyResponse:
+async def ready_probe() -> Response:
     app_ready: bool = lifecycle.is_ready()
-    services_healthy: bool = await lifecycle.are_all_services_healthy()
+    services_healthy: bool = app_ready and await _services_healthy()
 
-    if not app_ready and services_healthy:
+    if not services_healthy:
         raise HTTPException(
             status_code=status.HTTP_503_SERVICE_UNAVAILABLE,
             detail="Application not ready.",
         )
 
-    return ReadyResponse(ready=True)
+    return _json(_READY_BODY)
 
 
 ## GET /info
@@ -83,14 +175,8 @@ async def ready_probe() -> ReadyResponse:
     response_model=InfoResponse,
     status_code=status.HTTP_200_OK,
 )
-async def info() -> InfoResponse:
-    return InfoResponse(
-        name=settings.APP_NAME,
-        version=settings.APP_VERSION,
-        environment=settings.ENV,
-        hostname=socket.gethostname(),
-        pid=os.getpid(),
-    )
+async def info() -> Response:
+    return _json(_INFO_BODY)
 
 
 ## GET /system
@@ -101,19 +187,25 @@ async def info() -> InfoResponse:
     response_model=SystemResponse,
     status_code=status.HTTP_200_OK,
 )
-async def system() -> SystemResponse:
-    event_loop_lag: float = await lifecycle.get_event_loop_lag(samples=1)
+async def system() -> Response:
     services_healthy: bool = await lifecycle.are_all_services_healthy()
 
     db_status: Literal["connected", "disconnected"] = (
         "connected" if services_healthy else "disconnected"
     )
 
-    return SystemResponse(
-        uptime=round(time.perf_counter() - _start_time, 3),
-        timestamp=int(time.time() * 1000),
-        event_loop_lag=round(event_loop_lag, 3),
-        db=db_status,
+    return _json(
+        orjson.dumps(
+            {
+                "uptime": int(get_uptime() * 1_000) / 1_000,
+                "timestamp": time.time_ns() // 1_000_000,
+                "event_loop_lag": round(get_event_loop_lag(), 3),
+                "event_loop_lag_stats": {
+                    key: round(value, 3) for key, value in get_lag_stats().items()
+                },
+                "db": db_status,
+            }
+        )
     )
 
 
@@ -1,4 +1,4 @@
-from pydantic import BaseModel, Field
+from pydantic import BaseModel, ConfigDict, Field
 
 
 class HealthResponse(BaseModel):
@@ -19,3 +19,5 @@ class HealthResponse(BaseModel):
         description="Current server timestamp in ISO-8601 format.",
         examples=["2025-08-14T12:00:00Z"],
     )
+
+    model_config = ConfigDict(extra="ignore", validate_default=False)
@@ -1,6 +1,16 @@
 from typing import Literal
 
-from pydantic import BaseModel, Field
+from pydantic import BaseModel, ConfigDict, Field
+
+
+class EventLoopLagStats(BaseModel):
+    min: float = Field(..., description="Smallest sampled lag in milliseconds.")
+    mean: float = Field(..., description="Mean sampled lag in milliseconds.")
+    p90: float = Field(..., description="90th percentile lag in milliseconds.")
+    p99: float = Field(..., description="99th percentile lag in milliseconds.")
+    max: float = Field(..., description="Largest sampled lag in milliseconds.")
+
+    model_config = ConfigDict(extra="ignore", validate_default=False)
 
 
 class SystemResponse(BaseModel):
@@ -18,12 +28,19 @@ class SystemResponse(BaseModel):
 
     event_loop_lag: float = Field(
         ...,
-        description="Approximate event loop lag in milliseconds.",
+        description="Most recently sampled event loop lag in milliseconds.",
         examples=[3.21],
     )
 
+    event_loop_lag_stats: EventLoopLagStats = Field(
+        ...,
+        description="Distribution of the last 1,000 background lag samples.",
+    )
+
     db: Literal["connected", "disconnected"] = Field(
         ...,
         description="Database connectivity status.",
         examples=["connected"],
     )
+
+    model_config = ConfigDict(extra="ignore", validate_default=False)
@@ -0,0 +1,76 @@
+import asyncio
+import contextlib
+from collections import deque
+from collections.abc import Callable
+
+_samples: deque[float] = deque(maxlen=1_000)
+
+
+def get_event_loop_lag() -> float:
+    return _samples[-1] if _samples else 0.0
+
+
+def _compute_lag_stats() -> dict[str, float]:
+    if not _samples:
+        return {"min": 0.0, "mean": 0.0, "p90": 0.0, "p99": 0.0, "max": 0.0}
+
+    ordered: list[float] = sorted(_samples)
+    last: int = len(ordered) - 1
+
+    return {
+        "min": ordered[0],
+        "mean": sum(ordered) / len(ordered),
+        "p90": ordered[round(last * 0.90)],
+        "p99": ordered[round(last * 0.99)],
+        "max": ordered[-1],
+    }
+
+
+_stats: dict[str, float] = _compute_lag_stats()
+
+
+def get_lag_stats() -> dict[str, float]:
+    return _stats
+
+
+class EventLoopLagService:
+    name: str = "event loop lag monitor"
+    depends_on: tuple[str, ...] = ()
+
+    def __init__(self, interval: float = 0.5) -> None:
+        self.interval = interval
+        self._task: asyncio.Task[None] | None = None
+
+    async def _sample(self) -> None:
+        global _stats
+
+        now: Callable[[], float] = asyncio.get_running_loop().time
+        sleep = asyncio.sleep
+        interval: float = self.interval
+
+        while True:
+            start: float = now()
+            await sleep(interval)
+            _samples.append(max(0.0, now() - start - interval) * 1_000.0)
+            _stats = _compute_lag_stats()
+
+    async def start(self) -> None:
+        if self._task is None:
+            self._task = asyncio.create_task(self._sample())
+
+    async def stop(self) -> None:
+        global _stats
+
+        if self._task is not None:
+            self._task.cancel()
+
+            with contextlib.suppress(asyncio.CancelledError):
+                await self._task
+
+            self._task = None
+
+        _samples.clear()
+        _stats = _compute_lag_stats()
+
+    async def check(self) -> bool:
+        return self._task is not None and not self._task.done()
@@ -0,0 +1,49 @@
+import asyncio
+import contextlib
+import time
+
+_start_time: float = time.perf_counter()
+_uptime: float | None = None
+
+
+def get_uptime() -> float:
+    if _uptime is None:
+        return time.perf_counter() - _start_time
+
+    return _uptime
+
+
+class UptimeService:
+    name: str = "uptime clock"
+    depends_on: tuple[str, ...] = ()
+
+    def __init__(self, interval: float = 0.1) -> None:
+        self.interval = interval
+        self._task: asyncio.Task[None] | None = None
+
+    async def _tick(self) -> None:
+        global _uptime
+
+        while True:
+            _uptime = time.perf_counter() - _start_time
+            await asyncio.sleep(self.interval)
+
+    async def start(self) -> None:
+        if self._task is None:
+            self._task = asyncio.create_task(self._tick())
+
+    async def stop(self) -> None:
+        global _uptime
+
+        if self._task is not None:
+            self._task.cancel()
+
+            with contextlib.suppress(asyncio.CancelledError):
+                await self._task
+
+            self._task = None
+
+        _uptime = None
+
+    async def check(self) -> bool:
+        return self._task is not None and not self._task.done()
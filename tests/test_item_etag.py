@@ -0,0 +1,62 @@
+import os
+import tempfile
+import unittest
+
+_DB_DIR = tempfile.TemporaryDirectory()
+
+os.environ.update(
+    APP_NAME="QuickAPI",
+    APP_VERSION="1.0.0",
+    ENV="test",
+    LOG_LEVEL="ERROR",
+    PORT="5000",
+    DATABASE_URL=f"sqlite:///{_DB_DIR.name}/etag.db",
+)
+
+from fastapi.testclient import TestClient  # noqa: E402
+
+from app.config.application import create_app  # noqa: E402
+
+ITEMS = "/api/v1/items/"
+
+
+class ItemListETagTest(unittest.TestCase):
+    def test_patch_invalidates_list_etag_within_the_same_second(self) -> None:
+        with TestClient(create_app()) as client:
+            created = client.post(ITEMS, json={"name": "Sword", "price": 9.5})
+            self.assertEqual(created.status_code, 201)
+
+            listed = client.get(ITEMS)
+            etag: str = listed.headers["etag"]
+
+            patched = client.patch(f"{ITEMS}{created.json()['id']}", json={"price": 4})
+            self.assertEqual(patched.status_code, 200)
+
+            conditional = client.get(ITEMS, headers={"if-none-match": etag})
+
+            self.assertEqual(conditional.status_code, 200)
+            self.assertNotEqual(conditional.headers["etag"], etag)
+            prices: dict[str, float] = {
+                item["id"]: item["price"] for item in conditional.json()["data"]
+            }
+            self.assertEqual(prices[created.json()["id"]], 4)
+
+    def test_delete_and_insert_invalidate_list_etag_within_the_same_second(
+        self,
+    ) -> None:
+        with TestClient(create_app()) as client:
+            created = client.post(ITEMS, json={"name": "Axe", "price": 3})
+            etag: str = client.get(ITEMS).headers["etag"]
+
+            deleted = client.delete(f"{ITEMS}{created.json()['id']}")
+            self.assertEqual(deleted.status_code, 204)
+            client.post(ITEMS, json={"name": "Bow", "price": 3})
+
+            conditional = client.get(ITEMS, headers={"if-none-match": etag})
+
+            self.assertEqual(conditional.status_code, 200)
+            self.assertNotEqual(conditional.headers["etag"], etag)
+
+
+if __name__ == "__main__":
+    unittest.main()